@@ -1,17 +1,41 @@
 """
 Machine Learning Models Package for Healthcare Predictive Analytics
+
+The public names are loaded on first access (PEP 562), so importing the
+package does not import NumPy, pandas or scikit-learn until a model, the
+registry or the trainer is used.
 """
 
-from .diabetes_model import DiabetesModel
-from .heart_model import HeartModel
-from .kidney_model import KidneyModel
-from .stroke_model import StrokeModel
-from .hypertension_model import HypertensionModel
-
-__all__ = [
-    'DiabetesModel',
-    'HeartModel',
-    'KidneyModel',
-    'StrokeModel',
-    'HypertensionModel'
-]
\ No newline at end of file
+import importlib
+
+# public name -> module that defines it
+_EXPORTS = {
+    'BaseDiseaseModel': 'base_model',
+    'DiseaseSpec': 'base_model',
+    'DiabetesModel': 'diabetes_model',
+    'HeartModel': 'heart_model',
+    'KidneyModel': 'kidney_model',
+    'StrokeModel': 'stroke_model',
+    'HypertensionModel': 'hypertension_model',
+    'PredictionCache': 'prediction_cache',
+    'default_cache': 'prediction_cache',
+    'ModelRegistry': 'model_registry',
+    'get_model': 'model_registry',
+    'register_model': 'model_registry',
+    'TrainingConfig': 'training',
+    'train_all': 'training'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{_EXPORTS[name]}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,13 +1,9 @@
+from functools import lru_cache
+
 import streamlit as st
-import pandas as pd
 import numpy as np
-from ml_model.diabetes_model import DiabetesModel, get_feature_names as get_diabetes_features
-from ml_model.heart_model import HeartModel, get_feature_names as get_heart_features
-from ml_model.kidney_model import KidneyModel, get_feature_names as get_kidney_features
-from ml_model.stroke_model import StrokeModel, get_feature_names as get_stroke_features
-from ml_model.hypertension_model import HypertensionModel, get_feature_names as get_hypertension_features
-import plotly.graph_objects as go
-import plotly.express as px
+from ml_model.instrumentation import timed
+from ml_model.model_registry import FAILED, READY, get_model, registry
 
 # Page configuration
 st.set_page_config(
@@ -17,6 +13,14 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Load (or train) every model once per server process, on a background thread,
+# so no page request ever loads or trains a model itself
+@st.cache_resource
+def start_model_warm_up():
+    return registry.start_warm_up()
+
+start_model_warm_up()
+
 # Advanced Bootstrap CSS and Custom Styling
 st.markdown("""
     <style>
@@ -330,6 +334,10 @@ with st.sidebar:
         label_visibility="collapsed"
     )
     
+    if not registry.is_ready():
+        states = registry.status().values()
+        st.caption(f"Loading models: {sum(state['state'] == READY for state in states)}/{len(states)} ready")
+    
     st.markdown("---")
     st.markdown("""
         <div style="color: white; padding: 1rem;">
@@ -346,6 +354,52 @@ with st.sidebar:
         </div>
     """, unsafe_allow_html=True)
 
+# Result rendering: alert plus recommendation boxes as one cached HTML fragment
+RECOMMENDATION_BOXES = (
+    ('immediate_actions', 'fa-exclamation-circle', 'Immediate Actions'),
+    ('lifestyle_changes', 'fa-utensils', 'Lifestyle Changes'),
+    ('medical_advice', 'fa-pills', 'Medical Advice'),
+    ('prevention_tips', 'fa-shield-alt', 'Prevention Tips')
+)
+
+@lru_cache(maxsize=256)
+def result_html(label, risk_level, high_risk, *sections):
+    """Build the HTML for one result; sections are the recommendation tuples in RECOMMENDATION_BOXES order.
+
+    The tuples come from the shared recommendation tables, so each
+    (disease, risk level, sub-condition) is rendered once per process.
+    """
+    if high_risk:
+        alert = (f"<div class='alert-custom alert-danger'><h3><i class='fas fa-exclamation-triangle'></i> "
+                 f"{risk_level}</h3><p>{label} Risk Detected</p></div>")
+    else:
+        alert = (f"<div class='alert-custom alert-success'><h3><i class='fas fa-check-circle'></i> "
+                 f"{risk_level}</h3><p>Low {label} Risk</p></div>")
+    boxes = [
+        f"<div class='recommendation-box'><h3><i class='fas {icon}'></i> {title}</h3><ul>"
+        + ''.join(f"<li>{item}</li>" for item in items) + "</ul></div>"
+        for (_, icon, title), items in zip(RECOMMENDATION_BOXES, sections)
+    ]
+    return (f"{alert}<div class='row'><div class='col-md-6'>{boxes[0]}{boxes[1]}</div>"
+            f"<div class='col-md-6'>{boxes[2]}{boxes[3]}</div></div>")
+
+def render_result(label, prediction, recommendations):
+    """Send the alert and recommendation boxes to the browser as a single element"""
+    sections = [tuple(recommendations[key]) for key, _, _ in RECOMMENDATION_BOXES]
+    st.markdown(result_html(label, recommendations['risk_level'], bool(prediction == 1), *sections),
+                unsafe_allow_html=True)
+
+def ready_model(disease, label):
+    """Return the warmed-up model, or tell the user it is not available yet and stop this run"""
+    if not registry.is_ready(disease):
+        status = registry.status()[disease]
+        if status['state'] == FAILED:
+            st.error(f"The {label} model could not be loaded: {status.get('error')}")
+        else:
+            st.info(f"The {label} model is still loading. Please try again in a moment.")
+        st.stop()
+    return get_model(disease, train=False)
+
 # Home Page
 if disease_option == "Home":
     st.markdown("""
@@ -441,69 +495,34 @@ elif disease_option == "Diabetes":
             input_data = np.array([[pregnancies, glucose, blood_pressure, skin_thickness, 
                                    insulin, bmi, dpf, age]])
             
-            model = DiabetesModel()
-            prediction, probability = model.predict(input_data)
-            recommendations = model.get_recommendations(prediction, probability, input_data)
+            model = ready_model('diabetes', 'diabetes')
+            prediction, probability, recommendations = model.predict_with_recommendations(input_data)
             
             st.markdown("<div class='custom-card'>", unsafe_allow_html=True)
             st.markdown("<h2 style='color: #667eea;'><i class='fas fa-chart-line'></i> Prediction Results</h2>", unsafe_allow_html=True)
             
-            fig = go.Figure(go.Indicator(
-                mode="gauge+number",
-                value=recommendations['risk_score'],
-                domain={'x': [0, 1], 'y': [0, 1]},
-                title={'text': "Risk Score", 'font': {'size': 24, 'color': '#667eea'}},
-                gauge={
-                    'axis': {'range': [None, 100]},
-                    'bar': {'color': "darkred" if prediction == 1 else "green"},
-                    'steps': [
-                        {'range': [0, 30], 'color': "lightgreen"},
-                        {'range': [30, 70], 'color': "yellow"},
-                        {'range': [70, 100], 'color': "lightcoral"}
-                    ]
-                }
-            ))
-            fig.update_layout(height=300)
-            st.plotly_chart(fig, use_container_width=True)
-            
-            if prediction == 1:
-                st.markdown(f"""
-                    <div class="alert-custom alert-danger">
-                        <h3><i class="fas fa-exclamation-triangle"></i> {recommendations['risk_level']}</h3>
-                        <p>Diabetes Risk Detected</p>
-                    </div>
-                """, unsafe_allow_html=True)
-            else:
-                st.markdown(f"""
-                    <div class="alert-custom alert-success">
-                        <h3><i class="fas fa-check-circle"></i> {recommendations['risk_level']}</h3>
-                        <p>Low Diabetes Risk</p>
-                    </div>
-                """, unsafe_allow_html=True)
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown("<div class='recommendation-box'><h3><i class='fas fa-exclamation-circle'></i> Immediate Actions</h3><ul>", unsafe_allow_html=True)
-                for action in recommendations['immediate_actions']:
-                    st.markdown(f"<li>{action}</li>", unsafe_allow_html=True)
-                st.markdown("</ul></div>", unsafe_allow_html=True)
-                
-                st.markdown("<div class='recommendation-box'><h3><i class='fas fa-utensils'></i> Lifestyle Changes</h3><ul>", unsafe_allow_html=True)
-                for change in recommendations['lifestyle_changes']:
-                    st.markdown(f"<li>{change}</li>", unsafe_allow_html=True)
-                st.markdown("</ul></div>", unsafe_allow_html=True)
+            with timed('render_gauge', 'diabetes'):
+                import plotly.graph_objects as go  # only result pages need Plotly
+                fig = go.Figure(go.Indicator(
+                    mode="gauge+number",
+                    value=recommendations['risk_score'],
+                    domain={'x': [0, 1], 'y': [0, 1]},
+                    title={'text': "Risk Score", 'font': {'size': 24, 'color': '#667eea'}},
+                    gauge={
+                        'axis': {'range': [None, 100]},
+                        'bar': {'color': "darkred" if prediction == 1 else "green"},
+                        'steps': [
+                            {'range': [0, 30], 'color': "lightgreen"},
+                            {'range': [30, 70], 'color': "yellow"},
+                            {'range': [70, 100], 'color': "lightcoral"}
+                        ]
+                    }
+                ))
+                fig.update_layout(height=300)
+                st.plotly_chart(fig, use_container_width=True)
             
-            with col2:
-                st.markdown("<div class='recommendation-box'><h3><i class='fas fa-pills'></i> Medical Advice</h3><ul>", unsafe_allow_html=True)
-                for advice in recommendations['medical_advice']:
-                    st.markdown(f"<li>{advice}</li>", unsafe_allow_html=True)
-                st.markdown("</ul></div>", unsafe_allow_html=True)
-                
-                st.markdown("<div class='recommendation-box'><h3><i class='fas fa-shield-alt'></i> Prevention Tips</h3><ul>", unsafe_allow_html=True)
-                for tip in recommendations['prevention_tips']:
-                    st.markdown(f"<li>{tip}</li>", unsafe_allow_html=True)
-                st.markdown("</ul></div>", unsafe_allow_html=True)
+            with timed('render_result', 'diabetes'):
+                render_result('Diabetes', prediction, recommendations)
             
             st.markdown("</div>", unsafe_allow_html=True)
 
@@ -551,9 +570,8 @@ elif disease_option == "Heart Disease":
             input_data = np.array([[age, sex_val, cp_val, trestbps, chol, fbs_val, restecg_val, 
                                    thalach, exang_val, oldpeak, slope_val, ca, thal_val]])
             
-            model = HeartModel()
-            prediction, probability = model.predict(input_data)
-            recommendations = model.get_recommendations(prediction, probability, input_data)
+            model = ready_model('heart', 'heart disease')
+            prediction, probability, recommendations = model.predict_with_recommendations(input_data)
             
             st.markdown("<div class='custom-card'>", unsafe_allow_html=True)
             st.markdown("<h2 style='color: #667eea;'><i class='fas fa-chart-line'></i> Prediction Results</h2>", unsafe_allow_html=True)
@@ -561,23 +579,25 @@ elif disease_option == "Heart Disease":
             col1, col2, col3 = st.columns(3)
             
             with col1:
-                fig = go.Figure(go.Indicator(
-                    mode="gauge+number",
-                    value=recommendations['risk_score'],
-                    domain={'x': [0, 1], 'y': [0, 1]},
-                    title={'text': "Risk Score", 'font': {'size': 20}},
-                    gauge={
-                        'axis': {'range': [None, 100]},
-                        'bar': {'color': "darkred" if prediction == 1 else "green"},
-                        'steps': [
-                            {'range': [0, 30], 'color': "lightgreen"},
-                            {'range': [30, 70], 'color': "yellow"},
-                            {'range': [70, 100], 'color': "lightcoral"}
-                        ]
-                    }
-                ))
-                fig.update_layout(height=250)
-                st.plotly_chart(fig, use_container_width=True)
+                with timed('render_gauge', 'heart'):
+                    import plotly.graph_objects as go
+                    fig = go.Figure(go.Indicator(
+                        mode="gauge+number",
+                        value=recommendations['risk_score'],
+                        domain={'x': [0, 1], 'y': [0, 1]},
+                        title={'text': "Risk Score", 'font': {'size': 20}},
+                        gauge={
+                            'axis': {'range': [None, 100]},
+                            'bar': {'color': "darkred" if prediction == 1 else "green"},
+                            'steps': [
+                                {'range': [0, 30], 'color': "lightgreen"},
+                                {'range': [30, 70], 'color': "yellow"},
+                                {'range': [70, 100], 'color': "lightcoral"}
+                            ]
+                        }
+                    ))
+                    fig.update_layout(height=250)
+                    st.plotly_chart(fig, use_container_width=True)
             
             with col2:
                 st.metric("Max Heart Rate", f"{recommendations['heart_analysis']['max_heart_rate']} bpm")
@@ -587,44 +607,8 @@ elif disease_option == "Heart Disease":
                 st.metric("Heart Rate %", f"{recommendations['heart_analysis']['percentage']:.1f}%")
                 st.info(f"**Status:** {recommendations['heart_analysis']['status']}")
             
-            if prediction == 1:
-                st.markdown(f"""
-                    <div class="alert-custom alert-danger">
-                        <h3><i class="fas fa-exclamation-triangle"></i> {recommendations['risk_level']}</h3>
-                        <p>Heart Disease Risk Detected</p>
-                    </div>
-                """, unsafe_allow_html=True)
-            else:
-                st.markdown(f"""
-                    <div class="alert-custom alert-success">
-                        <h3><i class="fas fa-check-circle"></i> {recommendations['risk_level']}</h3>
-                        <p>Low Heart Disease Risk</p>
-                    </div>
-                """, unsafe_allow_html=True)
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown("<div class='recommendation-box'><h3><i class='fas fa-exclamation-circle'></i> Immediate Actions</h3><ul>", unsafe_allow_html=True)
-                for action in recommendations['immediate_actions']:
-                    st.markdown(f"<li>{action}</li>", unsafe_allow_html=True)
-                st.markdown("</ul></div>", unsafe_allow_html=True)
-                
-                st.markdown("<div class='recommendation-box'><h3><i class='fas fa-utensils'></i> Lifestyle Changes</h3><ul>", unsafe_allow_html=True)
-                for change in recommendations['lifestyle_changes']:
-                    st.markdown(f"<li>{change}</li>", unsafe_allow_html=True)
-                st.markdown("</ul></div>", unsafe_allow_html=True)
-            
-            with col2:
-                st.markdown("<div class='recommendation-box'><h3><i class='fas fa-pills'></i> Medical Advice</h3><ul>", unsafe_allow_html=True)
-                for advice in recommendations['medical_advice']:
-                    st.markdown(f"<li>{advice}</li>", unsafe_allow_html=True)
-                st.markdown("</ul></div>", unsafe_allow_html=True)
-                
-                st.markdown("<div class='recommendation-box'><h3><i class='fas fa-shield-alt'></i> Prevention Tips</h3><ul>", unsafe_allow_html=True)
-                for tip in recommendations['prevention_tips']:
-                    st.markdown(f"<li>{tip}</li>", unsafe_allow_html=True)
-                st.markdown("</ul></div>", unsafe_allow_html=True)
+            with timed('render_result', 'heart'):
+                render_result('Heart Disease', prediction, recommendations)
             
             st.markdown("</div>", unsafe_allow_html=True)
 
@@ -687,69 +671,34 @@ elif disease_option == "Kidney Disease":
                                    bu, sc, sod, pot, hemo, pcv, wc, rc, htn_val, dm_val, cad_val, 
                                    appet_val, pe_val, ane_val]])
             
-            model = KidneyModel()
-            prediction, probability = model.predict(input_data)
-            recommendations = model.get_recommendations(prediction, probability, input_data)
+            model = ready_model('kidney', 'kidney disease')
+            prediction, probability, recommendations = model.predict_with_recommendations(input_data)
             
             st.markdown("<div class='custom-card'>", unsafe_allow_html=True)
             st.markdown("<h2 style='color: #667eea;'><i class='fas fa-chart-line'></i> Prediction Results</h2>", unsafe_allow_html=True)
             
-            fig = go.Figure(go.Indicator(
-                mode="gauge+number",
-                value=recommendations['risk_score'],
-                domain={'x': [0, 1], 'y': [0, 1]},
-                title={'text': "Risk Score", 'font': {'size': 24, 'color': '#667eea'}},
-                gauge={
-                    'axis': {'range': [None, 100]},
-                    'bar': {'color': "darkred" if prediction == 1 else "green"},
-                    'steps': [
-                        {'range': [0, 30], 'color': "lightgreen"},
-                        {'range': [30, 70], 'color': "yellow"},
-                        {'range': [70, 100], 'color': "lightcoral"}
-                    ]
-                }
-            ))
-            fig.update_layout(height=300)
-            st.plotly_chart(fig, use_container_width=True)
-            
-            if prediction == 1:
-                st.markdown(f"""
-                    <div class="alert-custom alert-danger">
-                        <h3><i class="fas fa-exclamation-triangle"></i> {recommendations['risk_level']}</h3>
-                        <p>Kidney Disease Risk Detected</p>
-                    </div>
-                """, unsafe_allow_html=True)
-            else:
-                st.markdown(f"""
-                    <div class="alert-custom alert-success">
-                        <h3><i class="fas fa-check-circle"></i> {recommendations['risk_level']}</h3>
-                        <p>Low Kidney Disease Risk</p>
-                    </div>
-                """, unsafe_allow_html=True)
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown("<div class='recommendation-box'><h3><i class='fas fa-exclamation-circle'></i> Immediate Actions</h3><ul>", unsafe_allow_html=True)
-                for action in recommendations['immediate_actions']:
-                    st.markdown(f"<li>{action}</li>", unsafe_allow_html=True)
-                st.markdown("</ul></div>", unsafe_allow_html=True)
-                
-                st.markdown("<div class='recommendation-box'><h3><i class='fas fa-utensils'></i> Lifestyle Changes</h3><ul>", unsafe_allow_html=True)
-                for change in recommendations['lifestyle_changes']:
-                    st.markdown(f"<li>{change}</li>", unsafe_allow_html=True)
-                st.markdown("</ul></div>", unsafe_allow_html=True)
+            with timed('render_gauge', 'kidney'):
+                import plotly.graph_objects as go
+                fig = go.Figure(go.Indicator(
+                    mode="gauge+number",
+                    value=recommendations['risk_score'],
+                    domain={'x': [0, 1], 'y': [0, 1]},
+                    title={'text': "Risk Score", 'font': {'size': 24, 'color': '#667eea'}},
+                    gauge={
+                        'axis': {'range': [None, 100]},
+                        'bar': {'color': "darkred" if prediction == 1 else "green"},
+                        'steps': [
+                            {'range': [0, 30], 'color': "lightgreen"},
+                            {'range': [30, 70], 'color': "yellow"},
+                            {'range': [70, 100], 'color': "lightcoral"}
+                        ]
+                    }
+                ))
+                fig.update_layout(height=300)
+                st.plotly_chart(fig, use_container_width=True)
             
-            with col2:
-                st.markdown("<div class='recommendation-box'><h3><i class='fas fa-pills'></i> Medical Advice</h3><ul>", unsafe_allow_html=True)
-                for advice in recommendations['medical_advice']:
-                    st.markdown(f"<li>{advice}</li>", unsafe_allow_html=True)
-                st.markdown("</ul></div>", unsafe_allow_html=True)
-                
-                st.markdown("<div class='recommendation-box'><h3><i class='fas fa-shield-alt'></i> Prevention Tips</h3><ul>", unsafe_allow_html=True)
-                for tip in recommendations['prevention_tips']:
-                    st.markdown(f"<li>{tip}</li>", unsafe_allow_html=True)
-                st.markdown("</ul></div>", unsafe_allow_html=True)
+            with timed('render_result', 'kidney'):
+                render_result('Kidney Disease', prediction, recommendations)
             
             st.markdown("</div>", unsafe_allow_html=True)
 
@@ -784,81 +733,43 @@ elif disease_option == "Stroke":
     
     if st.button("🔍 Predict Stroke Risk", type="primary"):
         with st.spinner("Analyzing your stroke risk..."):
-            temp_model = StrokeModel()
-            temp_model.train()
+            model = ready_model('stroke', 'stroke')
             
-            gender_encoded = temp_model.label_encoders['gender'].transform([gender])[0]
-            ever_married_encoded = temp_model.label_encoders['ever_married'].transform([ever_married])[0]
-            work_type_encoded = temp_model.label_encoders['work_type'].transform([work_type])[0]
-            residence_encoded = temp_model.label_encoders['Residence_type'].transform([residence_type])[0]
-            smoking_encoded = temp_model.label_encoders['smoking_status'].transform([smoking_status])[0]
+            input_data = [[gender, age, hypertension_val, heart_disease_val, ever_married,
+                           work_type, residence_type, avg_glucose, bmi, smoking_status]]
             
-            input_data = np.array([[gender_encoded, age, hypertension_val, heart_disease_val, 
-                                   ever_married_encoded, work_type_encoded, residence_encoded, 
-                                   avg_glucose, bmi, smoking_encoded]])
-            
-            prediction, probability = temp_model.predict(input_data)
-            recommendations = temp_model.get_recommendations(prediction, probability, input_data)
+            try:
+                prediction, probability = model.predict_raw(*input_data[0])
+            except ValueError as e:
+                st.error(f"Cannot assess stroke risk for this input: {e}")
+                st.stop()
+            recommendations = model.get_recommendations(prediction, probability, input_data)
             
             st.markdown("<div class='custom-card'>", unsafe_allow_html=True)
             st.markdown("<h2 style='color: #667eea;'><i class='fas fa-chart-line'></i> Prediction Results</h2>", unsafe_allow_html=True)
             
-            fig = go.Figure(go.Indicator(
-                mode="gauge+number",
-                value=recommendations['risk_score'],
-                domain={'x': [0, 1], 'y': [0, 1]},
-                title={'text': "Risk Score", 'font': {'size': 24, 'color': '#667eea'}},
-                gauge={
-                    'axis': {'range': [None, 100]},
-                    'bar': {'color': "darkred" if prediction == 1 else "green"},
-                    'steps': [
-                        {'range': [0, 30], 'color': "lightgreen"},
-                        {'range': [30, 70], 'color': "yellow"},
-                        {'range': [70, 100], 'color': "lightcoral"}
-                    ]
-                }
-            ))
-            fig.update_layout(height=300)
-            st.plotly_chart(fig, use_container_width=True)
-            
-            if prediction == 1:
-                st.markdown(f"""
-                    <div class="alert-custom alert-danger">
-                        <h3><i class="fas fa-exclamation-triangle"></i> {recommendations['risk_level']}</h3>
-                        <p>Stroke Risk Detected</p>
-                    </div>
-                """, unsafe_allow_html=True)
-            else:
-                st.markdown(f"""
-                    <div class="alert-custom alert-success">
-                        <h3><i class="fas fa-check-circle"></i> {recommendations['risk_level']}</h3>
-                        <p>Low Stroke Risk</p>
-                    </div>
-                """, unsafe_allow_html=True)
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown("<div class='recommendation-box'><h3><i class='fas fa-exclamation-circle'></i> Immediate Actions</h3><ul>", unsafe_allow_html=True)
-                for action in recommendations['immediate_actions']:
-                    st.markdown(f"<li>{action}</li>", unsafe_allow_html=True)
-                st.markdown("</ul></div>", unsafe_allow_html=True)
-                
-                st.markdown("<div class='recommendation-box'><h3><i class='fas fa-utensils'></i> Lifestyle Changes</h3><ul>", unsafe_allow_html=True)
-                for change in recommendations['lifestyle_changes']:
-                    st.markdown(f"<li>{change}</li>", unsafe_allow_html=True)
-                st.markdown("</ul></div>", unsafe_allow_html=True)
+            with timed('render_gauge', 'stroke'):
+                import plotly.graph_objects as go
+                fig = go.Figure(go.Indicator(
+                    mode="gauge+number",
+                    value=recommendations['risk_score'],
+                    domain={'x': [0, 1], 'y': [0, 1]},
+                    title={'text': "Risk Score", 'font': {'size': 24, 'color': '#667eea'}},
+                    gauge={
+                        'axis': {'range': [None, 100]},
+                        'bar': {'color': "darkred" if prediction == 1 else "green"},
+                        'steps': [
+                            {'range': [0, 30], 'color': "lightgreen"},
+                            {'range': [30, 70], 'color': "yellow"},
+                            {'range': [70, 100], 'color': "lightcoral"}
+                        ]
+                    }
+                ))
+                fig.update_layout(height=300)
+                st.plotly_chart(fig, use_container_width=True)
             
-            with col2:
-                st.markdown("<div class='recommendation-box'><h3><i class='fas fa-pills'></i> Medical Advice</h3><ul>", unsafe_allow_html=True)
-                for advice in recommendations['medical_advice']:
-                    st.markdown(f"<li>{advice}</li>", unsafe_allow_html=True)
-                st.markdown("</ul></div>", unsafe_allow_html=True)
-                
-                st.markdown("<div class='recommendation-box'><h3><i class='fas fa-shield-alt'></i> Prevention Tips</h3><ul>", unsafe_allow_html=True)
-                for tip in recommendations['prevention_tips']:
-                    st.markdown(f"<li>{tip}</li>", unsafe_allow_html=True)
-                st.markdown("</ul></div>", unsafe_allow_html=True)
+            with timed('render_result', 'stroke'):
+                render_result('Stroke', prediction, recommendations)
             
             st.markdown("</div>", unsafe_allow_html=True)
 
@@ -906,9 +817,8 @@ elif disease_option == "Hypertension":
             input_data = np.array([[age, sex_val, cp_val, trestbps, chol, fbs_val, restecg_val, 
                                    thalach, exang_val, oldpeak, slope_val, ca, thal_val]])
             
-            model = HypertensionModel()
-            prediction, probability = model.predict(input_data)
-            recommendations = model.get_recommendations(prediction, probability, input_data)
+            model = ready_model('hypertension', 'hypertension')
+            prediction, probability, recommendations = model.predict_with_recommendations(input_data)
             
             st.markdown("<div class='custom-card'>", unsafe_allow_html=True)
             st.markdown("<h2 style='color: #667eea;'><i class='fas fa-chart-line'></i> Prediction Results</h2>", unsafe_allow_html=True)
@@ -916,23 +826,25 @@ elif disease_option == "Hypertension":
             col1, col2, col3 = st.columns(3)
             
             with col1:
-                fig = go.Figure(go.Indicator(
-                    mode="gauge+number",
-                    value=recommendations['risk_score'],
-                    domain={'x': [0, 1], 'y': [0, 1]},
-                    title={'text': "Risk Score", 'font': {'size': 20}},
-                    gauge={
-                        'axis': {'range': [None, 100]},
-                        'bar': {'color': "darkred" if prediction == 1 else "green"},
-                        'steps': [
-                            {'range': [0, 30], 'color': "lightgreen"},
-                            {'range': [30, 70], 'color': "yellow"},
-                            {'range': [70, 100], 'color': "lightcoral"}
-                        ]
-                    }
-                ))
-                fig.update_layout(height=250)
-                st.plotly_chart(fig, use_container_width=True)
+                with timed('render_gauge', 'hypertension'):
+                    import plotly.graph_objects as go
+                    fig = go.Figure(go.Indicator(
+                        mode="gauge+number",
+                        value=recommendations['risk_score'],
+                        domain={'x': [0, 1], 'y': [0, 1]},
+                        title={'text': "Risk Score", 'font': {'size': 20}},
+                        gauge={
+                            'axis': {'range': [None, 100]},
+                            'bar': {'color': "darkred" if prediction == 1 else "green"},
+                            'steps': [
+                                {'range': [0, 30], 'color': "lightgreen"},
+                                {'range': [30, 70], 'color': "yellow"},
+                                {'range': [70, 100], 'color': "lightcoral"}
+                            ]
+                        }
+                    ))
+                    fig.update_layout(height=250)
+                    st.plotly_chart(fig, use_container_width=True)
             
             with col2:
                 st.metric("Systolic BP", f"{recommendations['bp_analysis']['systolic_bp']} mm Hg")
@@ -942,44 +854,8 @@ elif disease_option == "Hypertension":
                 st.markdown("### 🩺 BP Category")
                 st.info(recommendations['bp_analysis']['category'])
             
-            if prediction == 1:
-                st.markdown(f"""
-                    <div class="alert-custom alert-danger">
-                        <h3><i class="fas fa-exclamation-triangle"></i> {recommendations['risk_level']}</h3>
-                        <p>Hypertension Risk Detected</p>
-                    </div>
-                """, unsafe_allow_html=True)
-            else:
-                st.markdown(f"""
-                    <div class="alert-custom alert-success">
-                        <h3><i class="fas fa-check-circle"></i> {recommendations['risk_level']}</h3>
-                        <p>Low Hypertension Risk</p>
-                    </div>
-                """, unsafe_allow_html=True)
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown("<div class='recommendation-box'><h3><i class='fas fa-exclamation-circle'></i> Immediate Actions</h3><ul>", unsafe_allow_html=True)
-                for action in recommendations['immediate_actions']:
-                    st.markdown(f"<li>{action}</li>", unsafe_allow_html=True)
-                st.markdown("</ul></div>", unsafe_allow_html=True)
-                
-                st.markdown("<div class='recommendation-box'><h3><i class='fas fa-utensils'></i> Lifestyle Changes</h3><ul>", unsafe_allow_html=True)
-                for change in recommendations['lifestyle_changes']:
-                    st.markdown(f"<li>{change}</li>", unsafe_allow_html=True)
-                st.markdown("</ul></div>", unsafe_allow_html=True)
-            
-            with col2:
-                st.markdown("<div class='recommendation-box'><h3><i class='fas fa-pills'></i> Medical Advice</h3><ul>", unsafe_allow_html=True)
-                for advice in recommendations['medical_advice']:
-                    st.markdown(f"<li>{advice}</li>", unsafe_allow_html=True)
-                st.markdown("</ul></div>", unsafe_allow_html=True)
-                
-                st.markdown("<div class='recommendation-box'><h3><i class='fas fa-shield-alt'></i> Prevention Tips</h3><ul>", unsafe_allow_html=True)
-                for tip in recommendations['prevention_tips']:
-                    st.markdown(f"<li>{tip}</li>", unsafe_allow_html=True)
-                st.markdown("</ul></div>", unsafe_allow_html=True)
+            with timed('render_result', 'hypertension'):
+                render_result('Hypertension', prediction, recommendations)
             
             st.markdown("</div>", unsafe_allow_html=True)
 
@@ -0,0 +1,451 @@
+"""
+Shared load, preprocessing, training and inference path for the disease models
+
+Each disease is described by a DiseaseSpec: its feature order, target
+column, training-data dtypes, categorical and dropped columns, forest
+hyperparameters and where its files live. BaseDiseaseModel implements
+everything else once, so a model module only declares its spec and, where
+the recommendations depend on the inputs, overrides analyse().
+
+Trained models are kept in a ModelStore under <saved_dir>/<disease>/: each
+train() writes a new version and switches to it atomically (see
+model_store). Versions are named by a fingerprint of the training file's
+bytes and of everything else that shapes the model, so when a version with
+that fingerprint is already on disk train() switches to it and skips the
+fit. A forced fit of the same fingerprint is saved as a new version next
+to the old one, never over it. Files saved flat in saved_dir by earlier releases are still loaded
+while no version has been published.
+
+scikit-learn and pandas are imported only when a model is trained or
+served with the sklearn backend: loading an artifact and predicting with
+the compiled backend needs NumPy and joblib alone.
+
+A disease that needs nothing beyond the shared behaviour does not need a
+module at all, only a spec and its recommendation entries:
+
+    spec = DiseaseSpec(disease='asthma', target='label', features=(...))
+    register_model(BaseDiseaseModel.from_spec(spec))
+    recommendations.register('asthma', HIGH_RISK, ...)
+    recommendations.register('asthma', LOW_RISK, ...)
+"""
+
+import os
+from dataclasses import dataclass, field
+from typing import Mapping, Optional, Tuple
+
+import joblib
+import numpy as np
+
+from .compiled_forest import compile_for, compile_model
+from .instrumentation import instrumented, timed
+from .model_artifact import load_artifact, save_artifact
+from .model_registry import get_model
+from .model_store import ModelStore, VersionExists
+from .prediction_cache import cached_predict
+from .prediction_utils import (DEFAULT_DECISION_THRESHOLD, is_dataframe, labels_from_proba, to_feature_array,
+                               recommendations_batch)
+from .recommendations import HIGH_RISK, LOW_RISK, lookup
+from .training import DEFAULT_CONFIG
+
+SAVED_MODELS_DIR = 'ml_model/saved_models'
+
+
+@dataclass(frozen=True)
+class DiseaseSpec:
+    """Declarative description of one disease model.
+
+    features is the column order the forest is trained and queried in;
+    schema maps the training-data columns to the dtypes they are loaded
+    with. categorical columns are label-encoded, and drop columns are
+    removed before training. hyperparameters are passed to
+    RandomForestClassifier; stratify splits the holdout by class. Files
+    default to dataset/<disease>.csv and <saved_dir>/<disease>_*.
+    """
+    disease: str
+    target: str
+    features: Tuple[str, ...]
+    schema: Mapping[str, str] = field(default_factory=dict)
+    categorical: Tuple[str, ...] = ()
+    drop: Tuple[str, ...] = ()
+    hyperparameters: Mapping[str, object] = field(
+        default_factory=lambda: {'n_estimators': 100, 'random_state': 42})
+    stratify: bool = False
+    title: Optional[str] = None
+    data_path: Optional[str] = None
+    saved_dir: str = SAVED_MODELS_DIR
+
+    @property
+    def label(self):
+        """Human-readable disease name used in messages"""
+        return self.title or self.disease
+
+    @property
+    def default_data_path(self):
+        return self.data_path or f'dataset/{self.disease}.csv'
+
+
+class BaseDiseaseModel:
+    """Random forest disease model driven by a DiseaseSpec"""
+
+    spec: DiseaseSpec = None
+    backend = 'compiled'
+    # Larger batches go to scikit-learn when its files are on disk: the compiled
+    # traversal wins on small requests, scikit-learn's per-tree loops on big ones
+    compiled_max_rows = 512
+    decision_threshold = DEFAULT_DECISION_THRESHOLD
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.spec is not None:
+            cls.disease = cls.spec.disease
+
+    @classmethod
+    def from_spec(cls, spec, name=None):
+        """Return a model class for a spec that needs no behaviour of its own"""
+        name = name or ''.join(part.capitalize() for part in spec.disease.split('_')) + 'Model'
+        return type(name, (cls,), {'spec': spec, '__module__': cls.__module__})
+
+    @classmethod
+    def shared(cls):
+        """Return the process-wide loaded instance from the model registry"""
+        return get_model(cls.disease)
+
+    @classmethod
+    def get_feature_names(cls):
+        """Return the feature names in the order the model expects"""
+        return list(cls.spec.features)
+
+    def __init__(self):
+        spec = self.spec
+        self.model = None
+        self.compiled = None
+        self.scaler = None
+        self.label_encoders = {}
+        self.category_codes = {}
+        self.version = None
+        self.use_directory(spec.saved_dir)
+
+    def use_directory(self, saved_dir):
+        """Read and write this model's files under saved_dir instead of the spec's"""
+        self.saved_dir = saved_dir
+        self.store = ModelStore(os.path.join(saved_dir, self.disease))
+        self._use_files(saved_dir)
+
+    def _use_files(self, directory):
+        disease = self.disease
+        self.model_path = os.path.join(directory, f'{disease}_model.pkl')
+        self.scaler_path = os.path.join(directory, f'{disease}_scaler.pkl')
+        self.artifact_path = os.path.join(directory, f'{disease}.artifact')
+        self.encoders_path = os.path.join(directory, f'{disease}_encoders.pkl')
+
+    def build_forest(self, config):
+        """Return the unfitted forest described by the spec's hyperparameters"""
+        from sklearn.ensemble import RandomForestClassifier
+
+        return RandomForestClassifier(**self.spec.hyperparameters, n_jobs=config.n_jobs)
+
+    def training_fingerprint(self, data_path, config):
+        """Fingerprint of data_path's bytes and the settings that determine the trained model"""
+        import sklearn
+
+        from .model_artifact import ARTIFACT_VERSION
+        from .training import fingerprint
+
+        spec = self.spec
+        return fingerprint(data_path, {
+            'disease': spec.disease,
+            'target': spec.target,
+            'features': spec.features,
+            'schema': dict(spec.schema),
+            'categorical': spec.categorical,
+            'drop': spec.drop,
+            'hyperparameters': dict(spec.hyperparameters),
+            'stratify': spec.stratify,
+            'chunksize': config.chunksize,
+            'predict_n_jobs': config.predict_n_jobs,
+            'decision_threshold': self.decision_threshold,
+            'sklearn': sklearn.__version__,
+            'artifact_version': ARTIFACT_VERSION
+        })
+
+    def train(self, data_path=None, config=None):
+        """Train the model on data_path (default: the spec's dataset) and save it.
+
+        When config.reuse_cached is set (the default) and a saved version
+        has the same training fingerprint, the newest such version is
+        published and loaded instead. Otherwise the new fit is always
+        saved as a version of its own and published.
+        """
+        from sklearn.model_selection import train_test_split
+        from sklearn.preprocessing import LabelEncoder, StandardScaler
+
+        from .datasets import load_dataset
+        from .training import fit_streaming
+
+        spec = self.spec
+        data_path = data_path or spec.default_data_path
+        config = config or DEFAULT_CONFIG
+        if config.decision_threshold is not None:
+            self.decision_threshold = config.decision_threshold
+
+        fingerprint = self.training_fingerprint(data_path, config)
+        if config.reuse_cached:
+            cached = self.store.latest(fingerprint)
+            if cached is not None:
+                return self._reuse_version(cached)
+
+        forest = self.build_forest(config)
+
+        if config.chunksize:
+            # Stream the file in chunks so memory is bounded by the chunk size
+            fit = fit_streaming(forest, data_path, spec.target, config, schema=spec.schema,
+                                drop=spec.drop, categorical=spec.categorical)
+            self.model, self.scaler, self.label_encoders = fit.model, fit.scaler, fit.label_encoders
+            test_accuracy = fit.test_accuracy
+        else:
+            df = load_dataset(data_path, spec.schema)
+            if spec.drop:
+                df = df.drop(columns=list(spec.drop))
+
+            self.label_encoders = {}
+            for col in spec.categorical:
+                le = LabelEncoder()
+                df[col] = le.fit_transform(df[col])
+                self.label_encoders[col] = le
+
+            # Fit on a plain float64 array: inference passes arrays in feature order,
+            # so the scaler must not record the frame's column names
+            X = df.drop(spec.target, axis=1).to_numpy(dtype=np.float64, na_value=np.nan)
+            y = df[spec.target]
+            X_train, X_test, y_train, y_test = train_test_split(
+                X, y, test_size=0.2, random_state=42, stratify=y if spec.stratify else None
+            )
+
+            self.scaler = StandardScaler()
+            X_train_scaled = self.scaler.fit_transform(X_train)
+            self.model = forest
+            self.model.fit(X_train_scaled, y_train)
+            test_accuracy = self.model.score(self.scaler.transform(X_test), y_test)
+        self.model.set_params(n_jobs=config.predict_n_jobs)
+        self._build_category_codes()
+
+        # Fold the scaler into the forest thresholds for inference
+        fused = compile_model(self.model, self.scaler)
+        self.compiled = fused if self.backend == 'compiled' else None
+
+        if test_accuracy is not None:
+            print(f"{spec.label} model trained! Test accuracy: {test_accuracy:.3f}")
+
+        # Write model, scaler, encoders and the inference artifact as a new
+        # version, then switch CURRENT to it once the whole set is on disk.
+        # A forced fit of a saved fingerprint gets a name of its own, so the
+        # files published are always the ones fitted here
+        version = self.store.unused(fingerprint)
+        try:
+            with self.store.stage(version) as (version, directory):
+                self._use_files(directory)
+                joblib.dump(self.model, self.model_path)
+                joblib.dump(self.scaler, self.scaler_path)
+                if spec.categorical:
+                    joblib.dump(self.label_encoders, self.encoders_path)
+                save_artifact(self.artifact_path, fused, self.get_feature_names(), scaler=self.scaler,
+                              label_encoders=self.label_encoders,
+                              metadata={'disease': self.disease, 'version': version,
+                                        'decision_threshold': self.decision_threshold})
+        except VersionExists:
+            # A concurrent train() of the same fingerprint saved first; serve its files
+            return self._reuse_version(version)
+        self.store.publish(version)
+        self._use_files(self.store.path(version))
+        self.version = version
+        self.store.prune()
+
+        return self.model
+
+    def _reuse_version(self, version):
+        """Publish and load a saved version in place of training it again"""
+        if self.store.current() != version:
+            self.store.publish(version)
+        if not self.load_model():
+            raise FileNotFoundError(f"Version {version} in {self.store.root} is incomplete")
+        # Leave the instance as train() would: fitted model and scaler in memory
+        self.model = joblib.load(self.model_path)
+        self.scaler = joblib.load(self.scaler_path)
+        if self.spec.categorical:
+            self.label_encoders = joblib.load(self.encoders_path)
+            self._build_category_codes()
+        print(f"{self.spec.label} model unchanged; reusing version {version}")
+        return self.model
+
+    def _file_paths(self):
+        paths = [self.model_path, self.scaler_path, self.artifact_path]
+        if self.spec.categorical:
+            paths.insert(2, self.encoders_path)
+        return paths
+
+    def artifact_paths(self):
+        """Return the version pointer and the files the loaded model was read from.
+
+        Publishing a new version replaces the pointer, so the registry's
+        modification-time check notices it.
+        """
+        return [self.store.pointer_path, *self._file_paths()]
+
+    @instrumented('load')
+    def load_model(self):
+        """Load the memory-mapped artifact, or the pickled model, scaler and encoders.
+
+        The compiled backend only needs the category vocabularies, so
+        label_encoders stays empty and scikit-learn is not imported.
+        """
+        version = self.store.current()
+        if version is not None:
+            self._use_files(self.store.path(version))
+            self.version = version
+        if self.backend == 'compiled' and os.path.exists(self.artifact_path):
+            artifact = load_artifact(self.artifact_path)
+            self.compiled = artifact.compiled
+            self.decision_threshold = artifact.metadata.get('decision_threshold', self.decision_threshold)
+            self.category_codes = artifact.category_codes()
+            return True
+        legacy = [path for path in self._file_paths() if path != self.artifact_path]
+        if all(os.path.exists(path) for path in legacy):
+            self.model = joblib.load(self.model_path)
+            self.scaler = joblib.load(self.scaler_path)
+            if os.path.exists(self.artifact_path):
+                self.decision_threshold = load_artifact(self.artifact_path).metadata.get(
+                    'decision_threshold', self.decision_threshold)
+            if self.spec.categorical:
+                self.label_encoders = joblib.load(self.encoders_path)
+            self._build_category_codes()
+            self.compiled = compile_for(self)
+            return True
+        return False
+
+    def _ensure_loaded(self):
+        if self.model is None and self.compiled is None:
+            if not self.load_model():
+                self.train()
+
+    def _ensure_sklearn(self):
+        """Load the pickled forest and scaler next to the artifact; False if they are missing"""
+        if self.model is None:
+            if not (os.path.exists(self.model_path) and os.path.exists(self.scaler_path)):
+                return False
+            model = joblib.load(self.model_path)
+            # Scaler first: a concurrent predict_array() takes the sklearn path once model is set
+            self.scaler = joblib.load(self.scaler_path)
+            self.model = model
+        return True
+
+    def _build_category_codes(self):
+        """Cache label -> code lookups so encoding a request is a dict lookup"""
+        self.category_codes = {
+            col: {label: code for code, label in enumerate(le.classes_)}
+            for col, le in self.label_encoders.items()
+        }
+
+    def encode_frame(self, df):
+        """Return df with its categorical string columns label-encoded (a copy when any are)"""
+        if not self.category_codes:
+            return df
+        import pandas as pd
+
+        df = df.copy()
+        for col, codes in self.category_codes.items():
+            if col not in df.columns or pd.api.types.is_numeric_dtype(df[col]):
+                continue
+            encoded = df[col].map(codes)
+            unknown = encoded.isna()
+            if unknown.any():
+                labels = ', '.join(map(str, df.loc[unknown, col].unique()))
+                raise ValueError(f"Unknown {col} value(s): {labels}")
+            df[col] = encoded
+        return df
+
+    def encode_row(self, values):
+        """Encode one row of values in feature order as a 2-D float array.
+
+        Categorical columns may hold their string labels, which are encoded
+        with the persisted vocabularies.
+        """
+        self._ensure_loaded()
+        row = list(values)
+        for i, col in enumerate(self.spec.features):
+            codes = self.category_codes.get(col)
+            if codes is not None and isinstance(row[i], str):
+                try:
+                    row[i] = codes[row[i]]
+                except KeyError:
+                    raise ValueError(f"Unknown {col} value(s): {row[i]}") from None
+        return np.array([row], dtype=float)
+
+    def set_backend(self, backend):
+        """Select the inference backend: 'sklearn' or 'compiled' (flat arrays, scaler folded in)"""
+        self.backend = backend
+        self.compiled = compile_for(self)
+        return self
+
+    def predict(self, input_data):
+        """Make prediction on input data"""
+        predictions, probabilities = self.predict_array(input_data)
+        return predictions[0], probabilities[0]
+
+    def predict_with_recommendations(self, input_data):
+        """Return (prediction, probability, recommendations), cached across sessions by input"""
+        return cached_predict(self, input_data)
+
+    def predict_batch(self, X):
+        """Predict a batch of patients (2-D array or DataFrame) in one vectorized call"""
+        if self.spec.categorical and is_dataframe(X):
+            # String categories are encoded with the persisted label encoders
+            self._ensure_loaded()
+            X = self.encode_frame(X)
+        return self.predict_array(to_feature_array(X, self.get_feature_names()))
+
+    def predict_array(self, X):
+        """Predict an already validated 2-D float array in get_feature_names() order"""
+        self._ensure_loaded()
+
+        # One forest evaluation; the labels are derived from the probabilities
+        if self.compiled is not None and (len(X) <= self.compiled_max_rows or not self._ensure_sklearn()):
+            with timed('predict_proba', self.disease):
+                probabilities = self.compiled.predict_proba(X)
+            classes = self.compiled.classes_
+        else:
+            with timed('transform', self.disease):
+                input_scaled = self.scaler.transform(X)
+            with timed('predict_proba', self.disease):
+                probabilities = self.model.predict_proba(input_scaled)
+            classes = self.model.classes_
+
+        predictions = labels_from_proba(probabilities, classes, self.decision_threshold)
+        return predictions, probabilities
+
+    def get_recommendations_batch(self, predictions, probabilities):
+        """Get risk scores and risk levels for a whole batch of predictions"""
+        return recommendations_batch(predictions, probabilities)
+
+    def analyse(self, prediction, input_data):
+        """Return (sub_condition, extra fields) for the recommendations of one patient.
+
+        The default has no sub-conditions; models whose advice depends on
+        the inputs override this.
+        """
+        return None, {}
+
+    @instrumented('get_recommendations')
+    def get_recommendations(self, prediction, probability, input_data):
+        """Get personalized recommendations based on prediction"""
+        # Handle probability array - it should have shape (2,) with [prob_class_0, prob_class_1]
+        if len(probability) > 1:
+            risk_score = probability[1] * 100  # Probability of class 1 (high risk)
+        else:
+            risk_score = probability[0] * 100 if prediction == 1 else (1 - probability[0]) * 100
+
+        risk_level = HIGH_RISK if prediction == 1 else LOW_RISK
+        sub_condition, analysis = self.analyse(prediction, input_data)
+        recommendations = lookup(self.disease, risk_level, sub_condition).copy()
+        recommendations['risk_score'] = risk_score
+        recommendations.update(analysis)
+        return recommendations
@@ -0,0 +1,256 @@
+"""
+Benchmarks for model loading, prediction latency, batch throughput and training
+
+Usage:
+    python -m ml_model.benchmarks --out bench.json [--diseases heart stroke]
+        [--backends compiled sklearn] [--batch-sizes 1 100 10000 1000000]
+        [--train-rows 10000] [--repeats 200] [--skip-train]
+    python -m ml_model.benchmarks --check-imports
+
+For each disease and inference backend this records:
+  * load_ms          load_model() time for a fresh instance (files in page cache)
+  * single_row_ms    p50/p95/p99 of predict() on one row
+  * batch            rows/second of predict_array() at each batch size; batches
+                     above compiled_max_rows use scikit-learn under both backends
+and per disease:
+  * train_seconds    train() wall time on a synthetic dataset of --train-rows rows
+                     (written to a temporary directory)
+plus the process's peak RSS, and:
+  * imports          import time of the package, the service and the compiled
+                     inference path, each in a fresh interpreter, with the
+                     heavy libraries it pulled in
+Inference is only measured for models already saved; nothing is trained
+into saved_models/, and a disease without a saved model is recorded as
+skipped. Results are written as JSON together with the git commit and
+library versions, so runs can be compared across commits. --check-imports
+runs only the import benchmark and exits non-zero if a path imports a
+library it must not (see IMPORT_CHECKS).
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from .model_registry import MODEL_CLASSES, ModelNotReady, get_model, get_model_class
+from .screening import get_feature_names
+from .synthetic import generate_dataset
+
+DEFAULT_BATCH_SIZES = (1, 100, 10_000, 1_000_000)
+
+HEAVY_MODULES = ('numpy', 'joblib', 'pandas', 'sklearn', 'scipy', 'plotly')
+
+# name -> (code timed in a fresh interpreter, heavy modules it must not import)
+IMPORT_CHECKS = {
+    'package': ('import ml_model', HEAVY_MODULES),
+    'service': ('import ml_model.service', ('pandas', 'sklearn', 'scipy', 'plotly')),
+    'compiled_inference': (
+        'from ml_model.model_registry import MODEL_CLASSES, get_model_class\n'
+        'for disease in MODEL_CLASSES:\n'
+        '    model = get_model_class(disease)()\n'
+        '    if model.load_model():\n'
+        '        model.predict([[0.0] * len(model.get_feature_names())])',
+        ('pandas', 'sklearn', 'scipy', 'plotly')
+    )
+}
+
+_IMPORT_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+exec(compile({code!r}, '<import check>', 'exec'))
+seconds = time.perf_counter() - start
+print(json.dumps({{'seconds': seconds, 'modules': [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process so far"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _percentiles(samples):
+    ms = np.asarray(samples) * 1000
+    return {'p50': float(np.percentile(ms, 50)), 'p95': float(np.percentile(ms, 95)),
+            'p99': float(np.percentile(ms, 99)), 'mean': float(ms.mean())}
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def redirect_artifacts(model, directory):
+    """Point a model's saved files into directory so benchmarks never overwrite real models"""
+    model.use_directory(directory)
+    return model
+
+
+def feature_rows(disease, dataset_dir='dataset'):
+    """The bundled dataset's feature rows as a float array in model order"""
+    df = pd.read_csv(os.path.join(dataset_dir, f'{disease}.csv'))
+    if disease == 'stroke':
+        # The saved encoders are needed; never train into saved_models/ to get them
+        df = get_model('stroke', train=False).encode_frame(df)
+    return df[get_feature_names(disease)].to_numpy(dtype=float)
+
+
+def scaled_dataset(disease, n_rows, path, dataset_dir='dataset', random_state=0):
+    """Write a synthetic dataset of n_rows shaped like the bundled CSV"""
+    return generate_dataset(disease, n_rows, path, os.path.join(dataset_dir, f'{disease}.csv'),
+                            random_state=random_state)
+
+
+def bench_inference(disease, backend, rows, batch_sizes, repeats):
+    """Load time, single-row latency and batch throughput for one backend.
+
+    Raises ModelNotReady when no trained model is saved: predicting would
+    otherwise train one inline and write it into saved_models/.
+    """
+    model_class = get_model_class(disease)
+    load_times = []
+    for _ in range(5):
+        model = model_class().set_backend(backend)
+        start = time.perf_counter()
+        loaded = model.load_model()
+        load_times.append(time.perf_counter() - start)
+        if not loaded:
+            raise ModelNotReady(f"No trained {disease} model is saved; train it before benchmarking")
+
+    row = rows[:1]
+    model.predict(row)
+    latencies = []
+    for i in range(repeats):
+        row = rows[i % len(rows):i % len(rows) + 1]
+        start = time.perf_counter()
+        model.predict(row)
+        latencies.append(time.perf_counter() - start)
+
+    rng = np.random.default_rng(0)
+    batch = {}
+    for size in batch_sizes:
+        X = rows[rng.integers(0, len(rows), size)]
+        start = time.perf_counter()
+        model.predict_array(X)
+        elapsed = time.perf_counter() - start
+        batch[str(size)] = {'seconds': elapsed, 'rows_per_second': size / elapsed}
+
+    return {
+        'load_ms': _percentiles(load_times),
+        'single_row_ms': _percentiles(latencies),
+        'batch': batch
+    }
+
+
+def bench_training(disease, n_rows, dataset_dir='dataset'):
+    """Wall time of train() on a synthetic dataset of n_rows"""
+    with tempfile.TemporaryDirectory() as tmp:
+        data_path = scaled_dataset(disease, n_rows, os.path.join(tmp, f'{disease}.csv'), dataset_dir)
+        model = redirect_artifacts(get_model_class(disease)(), tmp)
+        start = time.perf_counter()
+        model.train(data_path)
+        return {'rows': n_rows, 'seconds': time.perf_counter() - start}
+
+
+def bench_imports(repeats=5):
+    """Time each IMPORT_CHECKS entry in fresh interpreters and record the heavy modules it loads"""
+    results = {}
+    for name, (code, forbidden) in IMPORT_CHECKS.items():
+        probe = _IMPORT_PROBE.format(code=code, heavy=HEAVY_MODULES)
+        times, modules = [], []
+        for _ in range(repeats):
+            out = subprocess.run([sys.executable, '-c', probe], capture_output=True, text=True, check=True)
+            sample = json.loads(out.stdout.strip().splitlines()[-1])
+            times.append(sample['seconds'])
+            modules = sample['modules']
+        unexpected = [m for m in modules if m in forbidden]
+        results[name] = {'ms': _percentiles(times), 'heavy_modules': modules,
+                         'unexpected': unexpected, 'ok': not unexpected}
+    return results
+
+
+def run(diseases=None, backends=('compiled', 'sklearn'), batch_sizes=DEFAULT_BATCH_SIZES,
+        train_rows=10_000, repeats=200, dataset_dir='dataset'):
+    """Run the benchmark suite and return the results as a dict"""
+    import sklearn
+
+    imports = bench_imports()
+    results = {}
+    for disease in diseases or MODEL_CLASSES:
+        print(f"Benchmarking {disease}...", file=sys.stderr)
+        try:
+            rows = feature_rows(disease, dataset_dir)
+            entry = {'backends': {b: bench_inference(disease, b, rows, batch_sizes, repeats) for b in backends}}
+        except ModelNotReady as e:
+            print(f"  skipping inference: {e}", file=sys.stderr)
+            entry = {'backends': {}, 'skipped': str(e)}
+        if train_rows:
+            entry['train'] = bench_training(disease, train_rows, dataset_dir)
+        entry['peak_rss_mb'] = peak_rss_mb()
+        results[disease] = entry
+
+    return {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'git_commit': _git_commit(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'sklearn': sklearn.__version__,
+            'cpu_count': os.cpu_count(),
+            'repeats': repeats
+        },
+        'results': results,
+        'imports': imports,
+        'peak_rss_mb': peak_rss_mb()
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the disease models")
+    parser.add_argument('--out', help="write JSON results here (default: stdout)")
+    parser.add_argument('--diseases', nargs='+', choices=sorted(MODEL_CLASSES))
+    parser.add_argument('--backends', nargs='+', default=['compiled', 'sklearn'], choices=['compiled', 'sklearn'])
+    parser.add_argument('--batch-sizes', nargs='+', type=int, default=list(DEFAULT_BATCH_SIZES))
+    parser.add_argument('--train-rows', type=int, default=10_000)
+    parser.add_argument('--repeats', type=int, default=200, help="single-row predictions per backend")
+    parser.add_argument('--skip-train', action='store_true')
+    parser.add_argument('--dataset-dir', default='dataset')
+    parser.add_argument('--check-imports', action='store_true',
+                        help="only run the import benchmark; fail if a path imports a forbidden library")
+    args = parser.parse_args(argv)
+
+    if args.check_imports:
+        imports = bench_imports()
+        for name, entry in imports.items():
+            status = 'ok' if entry['ok'] else f"imports {', '.join(entry['unexpected'])}"
+            print(f"  {name:<19} {entry['ms']['p50']:8.1f} ms  {status}")
+        if not all(entry['ok'] for entry in imports.values()):
+            sys.exit(1)
+        return
+
+    report = run(args.diseases, args.backends, args.batch_sizes,
+                 0 if args.skip_train else args.train_rows, args.repeats, args.dataset_dir)
+    output = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, 'w') as f:
+            f.write(output)
+        print(f"Wrote {args.out}", file=sys.stderr)
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""
+Combined heart disease and hypertension scoring
+
+HeartModel and HypertensionModel take exactly the same 13 features, so a
+patient screened for both conditions only needs the input validated and
+converted once before both forests are evaluated.
+"""
+
+from .heart_model import get_feature_names as get_heart_features
+from .hypertension_model import get_feature_names as get_hypertension_features
+from .model_registry import get_model
+from .prediction_utils import to_feature_array, recommendations_batch
+
+CARDIOVASCULAR_DISEASES = ('heart', 'hypertension')
+
+
+def get_feature_names():
+    """Return the feature names shared by the heart disease and hypertension models"""
+    features = get_heart_features()
+    if features != get_hypertension_features():
+        raise RuntimeError("Heart disease and hypertension models no longer share the same features")
+    return features
+
+
+def score_cardiovascular(input_data):
+    """Score heart disease and hypertension risk for the same patients in one call.
+
+    input_data is a 2-D array or DataFrame with the 13 shared features. It
+    is validated and converted once; with the default compiled backend the
+    scalers are folded into each forest, so no per-model preprocessing is
+    left. (With the sklearn backend each model still applies its own
+    scaler, since the two were fitted on different data.)
+
+    Returns a dict keyed by disease with 'prediction', 'probability',
+    'risk_score' and 'risk_level' arrays, one entry per input row. Raises
+    ModelNotReady if either model has not been trained yet.
+    """
+    X = to_feature_array(input_data, get_feature_names())
+
+    results = {}
+    for disease in CARDIOVASCULAR_DISEASES:
+        predictions, probabilities = get_model(disease, train=False).predict_array(X)
+        results[disease] = {
+            'prediction': predictions,
+            'probability': probabilities,
+            **recommendations_batch(predictions, probabilities)
+        }
+    return results
@@ -0,0 +1,251 @@
+"""
+Array-backed inference engine for fitted random forests
+
+CompiledForest copies the nodes of every tree in a fitted
+RandomForestClassifier into a handful of contiguous NumPy arrays and
+evaluates all trees for all rows with a vectorized traversal. For the
+single-row requests made by the app this avoids scikit-learn's input
+validation, joblib dispatch and per-tree Python calls.
+
+When a fitted StandardScaler is given, its transform is folded into the
+split thresholds: each threshold is moved back into raw feature space, so
+raw inputs can be compared directly and no transform is needed per request.
+The folded thresholds are exact, not approximate (see _fold_thresholds), and
+the probabilities are accumulated in the same order as scikit-learn, so the
+results are bit-for-bit identical to scaler.transform + forest.predict_proba.
+"""
+
+import numpy as np
+
+# Rows evaluated per block, so rows x trees index arrays stay a few MB
+_BLOCK_ELEMENTS = 1 << 20
+
+_INT64_MIN = np.iinfo(np.int64).min
+_FLOAT64_MAX = np.finfo(np.float64).max
+
+
+def _ordered_keys(values):
+    """Map float64 values to int64 keys with the same ordering"""
+    bits = np.ascontiguousarray(values, dtype=np.float64).view(np.int64)
+    return np.where(bits < 0, _INT64_MIN - bits, bits)
+
+
+def _from_ordered_keys(keys):
+    """Inverse of _ordered_keys"""
+    bits = np.where(keys < 0, _INT64_MIN - keys, keys)
+    return bits.astype(np.int64).view(np.float64)
+
+
+def _fold_thresholds(threshold, mean, scale):
+    """Move split thresholds from scaled space back to raw feature space.
+
+    A fitted tree sends x left when float32((x - mean) / scale) <= threshold
+    (the scaler works in float64, the tree casts its input to float32). That
+    function of x is monotone, so the set of x going left is exactly
+    x <= t for some float64 t. t is found by bisecting over the float64
+    values themselves (via their ordered bit patterns) rather than by
+    inverting the formula, so rounding can never send a row the other way.
+    """
+    def goes_left(x):
+        with np.errstate(over='ignore', invalid='ignore'):
+            return ((x - mean) / scale).astype(np.float32) <= threshold
+
+    lo = np.full(threshold.shape, _ordered_keys(np.array([-_FLOAT64_MAX]))[0], dtype=np.int64)
+    hi = np.full(threshold.shape, _ordered_keys(np.array([_FLOAT64_MAX]))[0], dtype=np.int64)
+    all_left = goes_left(_from_ordered_keys(hi))
+    none_left = ~goes_left(_from_ordered_keys(lo))
+
+    # Invariant: goes_left(lo) and not goes_left(hi)
+    for _ in range(64):
+        mid = (lo >> 1) + (hi >> 1) + (lo & hi & 1)
+        left = goes_left(_from_ordered_keys(mid))
+        lo = np.where(left, mid, lo)
+        hi = np.where(left, hi, mid)
+
+    folded = _from_ordered_keys(lo)
+    folded[all_left] = np.inf
+    folded[none_left] = -np.inf
+    return folded
+
+
+class CompiledForest:
+    """A fitted random forest flattened into contiguous node arrays"""
+
+    def __init__(self, feature, threshold, left, right, missing_left, value, roots,
+                 max_depth, classes, n_features, raw_input):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.missing_left = missing_left
+        self.value = value
+        self.roots = roots
+        self.max_depth = int(max_depth)
+        self.classes_ = classes
+        self.n_features = int(n_features)
+        # True when the scaler is folded in and inputs are compared unscaled in float64
+        self.raw_input = bool(raw_input)
+
+    @property
+    def n_trees(self):
+        return len(self.roots)
+
+    @classmethod
+    def from_estimator(cls, forest, scaler=None):
+        """Compile a fitted RandomForestClassifier, optionally folding in a fitted StandardScaler"""
+        features, thresholds, lefts, rights, missing, values, roots = [], [], [], [], [], [], []
+        offset = 0
+        max_depth = 0
+        for estimator in forest.estimators_:
+            tree = estimator.tree_
+            n_nodes = tree.node_count
+            is_leaf = tree.children_left == -1
+            node_ids = np.arange(offset, offset + n_nodes)
+
+            # Leaves point at themselves, so a row that reached one stops moving
+            features.append(np.where(is_leaf, 0, tree.feature))
+            thresholds.append(np.where(is_leaf, np.inf, tree.threshold))
+            lefts.append(np.where(is_leaf, node_ids, tree.children_left + offset))
+            rights.append(np.where(is_leaf, node_ids, tree.children_right + offset))
+            if hasattr(tree, 'missing_go_to_left'):
+                missing.append(np.asarray(tree.missing_go_to_left, dtype=bool))
+            else:
+                missing.append(np.zeros(n_nodes, dtype=bool))
+
+            # Same normalisation as DecisionTreeClassifier.predict_proba
+            proba = tree.value[:, 0, :forest.n_classes_].astype(np.float64)
+            normalizer = proba.sum(axis=1)[:, np.newaxis]
+            normalizer[normalizer == 0.0] = 1.0
+            values.append(proba / normalizer)
+
+            roots.append(offset)
+            offset += n_nodes
+            max_depth = max(max_depth, tree.max_depth)
+
+        feature = np.concatenate(features).astype(np.intp)
+        threshold = np.concatenate(thresholds).astype(np.float64)
+        if scaler is not None:
+            split = np.isfinite(threshold)
+            threshold[split] = _fold_thresholds(
+                threshold[split],
+                np.asarray(scaler.mean_, dtype=np.float64)[feature[split]],
+                np.asarray(scaler.scale_, dtype=np.float64)[feature[split]]
+            )
+
+        return cls(
+            feature=feature,
+            threshold=threshold,
+            left=np.concatenate(lefts).astype(np.intp),
+            right=np.concatenate(rights).astype(np.intp),
+            missing_left=np.concatenate(missing),
+            value=np.ascontiguousarray(np.concatenate(values)),
+            roots=np.asarray(roots, dtype=np.intp),
+            max_depth=max_depth,
+            classes=np.asarray(forest.classes_),
+            n_features=forest.n_features_in_,
+            raw_input=scaler is not None
+        )
+
+    def _leaves(self, X):
+        """Return the leaf reached by every row in every tree, shape (n_trees, n_rows).
+
+        Each step only advances the (tree, row) pairs that have not reached a
+        leaf yet, so the work follows the actual path lengths rather than
+        max_depth for every pair: deep forests have a few long branches and
+        most rows stop far earlier.
+        """
+        n_rows, n_features = X.shape
+        flat = X.ravel()
+        node = np.repeat(self.roots, n_rows)
+        active = np.arange(node.size)
+        # Offset of each active pair's row in flat
+        row_start = np.tile(np.arange(n_rows) * n_features, self.n_trees)
+        has_missing = np.isnan(flat).any()
+        while active.size:
+            current = node[active]
+            x = flat[row_start + self.feature[current]]
+            go_left = x <= self.threshold[current]
+            if has_missing:
+                go_left |= np.isnan(x) & self.missing_left[current]
+            step = np.where(go_left, self.left[current], self.right[current])
+            node[active] = step
+            # Leaves point at themselves, so a pair that did not move is done
+            moved = step != current
+            active = active[moved]
+            row_start = row_start[moved]
+        return node.reshape(self.n_trees, n_rows)
+
+    def predict_proba(self, X):
+        """Class probabilities for raw (or, without a folded scaler, scaled) inputs"""
+        # The forest compares float32 inputs; folded thresholds already account for that
+        X = np.asarray(X, dtype=np.float64 if self.raw_input else np.float32)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+
+        proba = np.empty((X.shape[0], self.value.shape[1]), dtype=np.float64)
+        block = max(1, _BLOCK_ELEMENTS // self.n_trees)
+        for start in range(0, X.shape[0], block):
+            leaves = self._leaves(X[start:start + block])
+            # Reducing over the leading (tree) axis adds trees one after another,
+            # matching the order RandomForestClassifier accumulates them in
+            proba[start:start + block] = self.value[leaves].sum(axis=0)
+        proba /= self.n_trees
+        return proba
+
+    def predict(self, X):
+        """Predicted class labels"""
+        return self.predict_with_proba(X)[0]
+
+    def predict_with_proba(self, X):
+        """Return (labels, probabilities) from a single traversal of the forest"""
+        proba = self.predict_proba(X)
+        return self.classes_.take(np.argmax(proba, axis=1), axis=0), proba
+
+    def probe_inputs(self, n_rows=256, random_state=0):
+        """Rows that sit exactly on, and just above, randomly chosen split thresholds"""
+        rng = np.random.default_rng(random_state)
+        split = np.flatnonzero(np.isfinite(self.threshold))
+        X = np.zeros((n_rows, self.n_features))
+        for f in range(self.n_features):
+            candidates = self.threshold[split[self.feature[split] == f]]
+            if len(candidates) == 0:
+                continue
+            candidates = np.concatenate([candidates, np.nextafter(candidates, np.inf)])
+            X[:, f] = rng.choice(candidates, size=n_rows)
+        return X
+
+
+def verify(compiled, forest, scaler=None, X=None):
+    """Check that compiled gives bit-identical probabilities to scikit-learn.
+
+    X defaults to rows built from the split thresholds, which exercises both
+    sides of every decision boundary the forest uses.
+    """
+    if X is None:
+        X = compiled.probe_inputs()
+        if not compiled.raw_input and scaler is not None:
+            raise ValueError("Probe rows need the scaler folded into the compiled forest")
+    X = np.asarray(X, dtype=np.float64)
+    expected = forest.predict_proba(scaler.transform(X) if scaler is not None else X)
+    return np.array_equal(compiled.predict_proba(X), expected)
+
+
+def compile_model(forest, scaler=None, check=True):
+    """Compile a fitted forest (and scaler) and, by default, verify the result"""
+    compiled = CompiledForest.from_estimator(forest, scaler)
+    if check and not verify(compiled, forest, scaler):
+        raise RuntimeError("Compiled forest does not reproduce the scikit-learn probabilities")
+    return compiled
+
+
+BACKENDS = ('sklearn', 'compiled')
+
+
+def compile_for(model):
+    """Return the compiled forest for a disease model using the compiled backend, else None"""
+    if model.backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{model.backend}'. Expected one of: {', '.join(BACKENDS)}")
+    if model.backend != 'compiled' or model.model is None:
+        return None
+    return compile_model(model.model, model.scaler)
+
@@ -0,0 +1,111 @@
+"""
+Dataset loading shared by the disease models
+
+Each model module declares a DATASET_SCHEMA mapping columns to compact
+dtypes (int8/int16, category). Integer columns that can be missing use
+pandas' nullable dtypes (Int8/Int16), which hold NA where int8 would
+fail to load. Fractional columns stay float64: rounding
+them to float32 moves the values the scaler and the split thresholds are
+fitted on, and so changes the trained forest. load_dataset() reads CSV with the
+pyarrow engine when it is installed, applies the schema, and keeps a
+converted Parquet copy next to the CSV (heart.csv -> heart.cache.parquet).
+The copy records the size and modification time (in nanoseconds) of the
+CSV it was converted from; later loads read it only while both still
+match and its columns still match the schema. Parquet inputs are read directly. Without pyarrow the
+loader falls back to pandas' own CSV parser and no cache is kept.
+"""
+
+import json
+import os
+import uuid
+
+import pandas as pd
+
+CACHE_SUFFIX = '.cache.parquet'
+# Parquet metadata key holding the signature of the CSV a cache was converted from
+SOURCE_KEY = b'ml_model.source'
+
+
+def cache_path(path):
+    """Where the converted copy of a CSV dataset is kept"""
+    return os.path.splitext(path)[0] + CACHE_SUFFIX
+
+
+def _is_parquet(path):
+    return os.path.splitext(path)[1].lower() in ('.parquet', '.pq')
+
+
+def _source_signature(path):
+    """Size and modification time of a file; a rewrite changes at least one"""
+    stat = os.stat(path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def _matches(df, schema):
+    """True when every declared column is present with its declared dtype"""
+    # Compare by name: a fitted category dtype carries its categories and never equals 'category'
+    return all(col in df and df[col].dtype.name == pd.api.types.pandas_dtype(dtype).name
+               for col, dtype in schema.items())
+
+
+def _read_csv(path, schema=None):
+    """Read a CSV with the declared dtypes, using the pyarrow parser when available"""
+    try:
+        return pd.read_csv(path, engine='pyarrow', dtype=schema)
+    except ImportError:
+        return pd.read_csv(path, dtype=schema)
+
+
+def _read_cache(path, schema):
+    try:
+        import pyarrow.parquet as pq
+
+        cached = cache_path(path)
+        # The footer alone says which CSV the copy came from; only a match reads the data
+        metadata = pq.read_schema(cached).metadata or {}
+        if json.loads(metadata.get(SOURCE_KEY, b'null')) != _source_signature(path):
+            return None
+        df = pq.read_table(cached).to_pandas()
+    except (ImportError, OSError, ValueError):
+        return None
+    return df if _matches(df, schema or {}) else None
+
+
+def _write_cache(df, path, source):
+    """Write the converted copy atomically; a read-only dataset dir or missing pyarrow just skips it"""
+    cached = cache_path(path)
+    # Unique per call, so concurrent loads in one process never share a file
+    tmp = f'{cached}.{uuid.uuid4().hex}.tmp'
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = {**(table.schema.metadata or {}), SOURCE_KEY: json.dumps(source).encode()}
+        pq.write_table(table.replace_schema_metadata(metadata), tmp)
+        os.replace(tmp, cached)
+    except (ImportError, OSError, ValueError):
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def load_dataset(path, schema=None, cache=True):
+    """Load a CSV or Parquet dataset with the declared column dtypes.
+
+    Columns not named in schema keep their inferred types. With cache=True
+    (the default) CSV loads go through the converted Parquet copy.
+    """
+    if _is_parquet(path):
+        df = pd.read_parquet(path)
+        return df.astype(schema) if schema else df
+
+    if cache:
+        df = _read_cache(path, schema)
+        if df is not None:
+            return df
+    # Taken before reading, so a CSV rewritten during the read invalidates the copy
+    source = _source_signature(path)
+    df = _read_csv(path, schema)
+    if cache:
+        _write_cache(df, path, source)
+    return df
@@ -0,0 +1,179 @@
+"""
+Opt-in per-stage timing for model calls and app rendering
+
+Disabled by default; when disabled timed() and instrumented() cost one
+flag check. Enable it with the ML_MODEL_METRICS=1 environment variable
+(1, true, yes or on; anything else leaves it off),
+or ML_MODEL_METRICS_LOG=/path/metrics.jsonl to also append a JSON snapshot
+to that file at exit, or by calling enable() in-process.
+
+Durations are kept as histograms per (stage, disease), with stages such as
+load, transform, predict_proba, get_recommendations, cache_miss and the
+app's render_* stages. to_prometheus() returns them in the Prometheus text
+exposition format (the inference service serves it at GET /metrics) and
+write_json() appends a snapshot to a JSON-lines log.
+"""
+
+import atexit
+import bisect
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+# Upper bounds in seconds, from 10 microseconds to 10 seconds
+DEFAULT_BUCKETS = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+METRIC_NAME = 'ml_model_stage_seconds'
+
+
+class Histogram:
+    """Counts of observed durations per bucket, plus their count, sum, min and max"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # the last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+
+    def observe(self, seconds):
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def cumulative(self):
+        """(upper bound, observations <= bound) pairs, ending with +Inf"""
+        total, pairs = 0, []
+        for bound, count in zip((*self.buckets, float('inf')), self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+    def quantile(self, q):
+        """Estimate a quantile as the upper bound of the bucket it falls in"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        for bound, total in self.cumulative():
+            if total >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'mean': self.sum / self.count if self.count else None,
+            'min': self.min if self.count else None,
+            'max': self.max if self.count else None,
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'p99': self.quantile(0.99)
+        }
+
+
+class Instrumentation:
+    """Thread-safe collection of stage histograms"""
+
+    def __init__(self, enabled=False, buckets=DEFAULT_BUCKETS):
+        self.enabled = enabled
+        self.buckets = buckets
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def observe(self, stage, seconds, disease=None):
+        key = (stage, disease or '')
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    @contextmanager
+    def _timer(self, stage, disease):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start, disease)
+
+    def timed(self, stage, disease=None):
+        """Context manager that records the duration of its block, when enabled"""
+        return self._timer(stage, disease) if self.enabled else nullcontext()
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+
+    def snapshot(self):
+        """Return {'timestamp': ..., 'stages': [{'stage', 'disease', 'count', 'sum', ...}]}"""
+        with self._lock:
+            stages = [{'stage': stage, 'disease': disease or None, **histogram.to_dict()}
+                      for (stage, disease), histogram in sorted(self._histograms.items())]
+        return {'timestamp': time.time(), 'stages': stages}
+
+    def to_prometheus(self):
+        """Render the histograms in the Prometheus text exposition format"""
+        lines = [f'# HELP {METRIC_NAME} Time spent in each model and app stage',
+                 f'# TYPE {METRIC_NAME} histogram']
+        with self._lock:
+            for (stage, disease), histogram in sorted(self._histograms.items()):
+                labels = f'stage="{stage}"' + (f',disease="{disease}"' if disease else '')
+                for bound, total in histogram.cumulative():
+                    le = '+Inf' if bound == float('inf') else repr(bound)
+                    lines.append(f'{METRIC_NAME}_bucket{{{labels},le="{le}"}} {total}')
+                lines.append(f'{METRIC_NAME}_sum{{{labels}}} {histogram.sum!r}')
+                lines.append(f'{METRIC_NAME}_count{{{labels}}} {histogram.count}')
+        return '\n'.join(lines) + '\n'
+
+    def write_json(self, path):
+        """Append the current snapshot to a JSON-lines file"""
+        with open(path, 'a') as f:
+            f.write(json.dumps(self.snapshot()) + '\n')
+
+
+def _env_flag(name):
+    """True if the environment variable is set to 1, true, yes or on"""
+    return os.environ.get(name, '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+metrics = Instrumentation(enabled=_env_flag('ML_MODEL_METRICS') or bool(os.environ.get('ML_MODEL_METRICS_LOG')))
+
+
+def enable():
+    metrics.enabled = True
+
+
+def disable():
+    metrics.enabled = False
+
+
+def timed(stage, disease=None):
+    """Time a block as a stage of the shared instrumentation"""
+    return metrics.timed(stage, disease)
+
+
+def instrumented(stage):
+    """Decorate a model method so each call is timed as stage, labelled with self.disease"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not metrics.enabled:
+                return method(self, *args, **kwargs)
+            with metrics.timed(stage, getattr(self, 'disease', None)):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+if os.environ.get('ML_MODEL_METRICS_LOG'):
+    atexit.register(metrics.write_json, os.environ['ML_MODEL_METRICS_LOG'])
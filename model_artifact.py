@@ -0,0 +1,174 @@
+"""
+Versioned single-file model artifacts
+
+An artifact holds everything inference needs for one disease: the compiled
+forest's node arrays (scaler already folded in), the scaler parameters,
+the categorical encoder vocabularies, the feature names and metadata.
+
+It is written with joblib without compression, which stores each NumPy
+array as a raw aligned block inside the file. load_artifact() opens it
+with mmap_mode='r', so the node arrays are mapped from the page cache
+rather than copied onto the heap: every worker process serving the same
+artifact shares one physical copy, and opening it takes milliseconds.
+
+Running this module checks the saved artifacts against the two-pickle
+(model + scaler) layout on the bundled datasets:
+
+    python -m ml_model.model_artifact [--dataset-dir dataset]
+"""
+
+import os
+import sys
+import time
+
+import joblib
+import numpy as np
+
+from .compiled_forest import CompiledForest
+
+ARTIFACT_FORMAT = 'ml_model-artifact'
+ARTIFACT_VERSION = 1
+
+_FOREST_ARRAYS = ('feature', 'threshold', 'left', 'right', 'missing_left', 'value', 'roots', 'classes_')
+
+
+class ModelArtifact:
+    """Contents of a loaded artifact file"""
+
+    def __init__(self, compiled, feature_names, scaler_mean=None, scaler_scale=None,
+                 encoders=None, metadata=None):
+        self.compiled = compiled
+        self.feature_names = list(feature_names)
+        self.scaler_mean = scaler_mean
+        self.scaler_scale = scaler_scale
+        self.encoders = encoders or {}
+        self.metadata = metadata or {}
+
+    def label_encoders(self):
+        """Rebuild fitted LabelEncoders from the stored vocabularies"""
+        from sklearn.preprocessing import LabelEncoder
+
+        encoders = {}
+        for col, classes in self.encoders.items():
+            le = LabelEncoder()
+            le.classes_ = np.asarray(classes)
+            encoders[col] = le
+        return encoders
+
+    def category_codes(self):
+        """Map each categorical column's labels to their codes, without importing scikit-learn"""
+        return {col: {label: code for code, label in enumerate(classes)} for col, classes in self.encoders.items()}
+
+
+def save_artifact(path, compiled, feature_names, scaler=None, label_encoders=None, metadata=None):
+    """Write a compiled forest and its preprocessing state to a single artifact file"""
+    import sklearn
+
+    data = {
+        'format': ARTIFACT_FORMAT,
+        'version': ARTIFACT_VERSION,
+        'feature_names': list(feature_names),
+        'forest': {name: np.ascontiguousarray(getattr(compiled, name)) for name in _FOREST_ARRAYS},
+        'forest_params': {
+            'max_depth': compiled.max_depth,
+            'n_features': compiled.n_features,
+            'raw_input': compiled.raw_input
+        },
+        'scaler': None if scaler is None else {
+            'mean': np.asarray(scaler.mean_, dtype=np.float64),
+            'scale': np.asarray(scaler.scale_, dtype=np.float64)
+        },
+        'encoders': {col: le.classes_.tolist() for col, le in (label_encoders or {}).items()},
+        'metadata': {
+            'created_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'sklearn_version': sklearn.__version__,
+            'n_trees': compiled.n_trees,
+            **(metadata or {})
+        }
+    }
+
+    # Write next to the destination and rename, so readers never see a partial file
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f'{path}.tmp{os.getpid()}'
+    joblib.dump(data, tmp_path)
+    os.replace(tmp_path, path)
+
+
+def load_artifact(path, mmap_mode='r'):
+    """Open an artifact file; node arrays are memory-mapped unless mmap_mode is None"""
+    data = joblib.load(path, mmap_mode=mmap_mode)
+    if not isinstance(data, dict) or data.get('format') != ARTIFACT_FORMAT:
+        raise ValueError(f"{path} is not a model artifact")
+    if data['version'] > ARTIFACT_VERSION:
+        raise ValueError(
+            f"{path} uses artifact version {data['version']}; this code reads up to {ARTIFACT_VERSION}"
+        )
+
+    # Plain ndarray views of the mapped buffers: no copy, but indexing them
+    # skips the np.memmap subclass overhead on every traversal step
+    forest = {name: np.asarray(array) for name, array in data['forest'].items()}
+    compiled = CompiledForest(
+        feature=forest['feature'],
+        threshold=forest['threshold'],
+        left=forest['left'],
+        right=forest['right'],
+        missing_left=forest['missing_left'],
+        value=forest['value'],
+        roots=forest['roots'],
+        classes=forest['classes_'],
+        **data['forest_params']
+    )
+    scaler = data['scaler'] or {}
+    return ModelArtifact(
+        compiled,
+        data['feature_names'],
+        scaler_mean=scaler.get('mean'),
+        scaler_scale=scaler.get('scale'),
+        encoders=data['encoders'],
+        metadata=data['metadata']
+    )
+
+
+def check_artifacts(dataset_dir='dataset'):
+    """Compare the saved artifacts with model + scaler predictions on the bundled CSVs.
+
+    Returns a dict of disease -> True/False (None when the disease has no
+    artifact yet).
+    """
+    import pandas as pd
+    from .model_registry import MODEL_CLASSES, get_model_class
+
+    results = {}
+    for disease in MODEL_CLASSES:
+        model_class = get_model_class(disease)
+        compiled = model_class()
+        legacy = model_class().set_backend('sklearn')
+        if not (compiled.load_model() and os.path.exists(compiled.artifact_path) and legacy.load_model()):
+            results[disease] = None
+            continue
+
+        df = pd.read_csv(os.path.join(dataset_dir, f'{disease}.csv'))
+        expected_labels, expected_proba = legacy.predict_batch(df)
+        labels, proba = compiled.predict_batch(df)
+        results[disease] = bool(np.array_equal(labels, expected_labels) and np.array_equal(proba, expected_proba))
+    return results
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Check the saved model artifacts against model + scaler")
+    parser.add_argument('--dataset-dir', default='dataset')
+    args = parser.parse_args(argv)
+
+    results = check_artifacts(args.dataset_dir)
+    for disease, ok in results.items():
+        status = 'no artifact' if ok is None else ('identical' if ok else 'MISMATCH')
+        print(f"  {disease:<13} {status}")
+    if not all(ok is not False for ok in results.values()):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
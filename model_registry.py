@@ -0,0 +1,224 @@
+"""
+Process-wide registry of loaded disease models
+"""
+
+import importlib
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# disease name -> (module, class) of the model implementing it, or the class
+# itself for models added at runtime with register_model()
+MODEL_CLASSES = {
+    'diabetes': ('diabetes_model', 'DiabetesModel'),
+    'heart': ('heart_model', 'HeartModel'),
+    'kidney': ('kidney_model', 'KidneyModel'),
+    'stroke': ('stroke_model', 'StrokeModel'),
+    'hypertension': ('hypertension_model', 'HypertensionModel'),
+}
+
+
+def get_model_class(disease):
+    """Return the model class registered for a disease"""
+    if disease not in MODEL_CLASSES:
+        raise KeyError(f"Unknown disease '{disease}'. Expected one of: {', '.join(MODEL_CLASSES)}")
+    entry = MODEL_CLASSES[disease]
+    if not isinstance(entry, tuple):
+        return entry
+    module_name, class_name = entry
+    module = importlib.import_module(f'.{module_name}', __package__)
+    return getattr(module, class_name)
+
+
+def register_model(model_class):
+    """Make a model class (e.g. BaseDiseaseModel.from_spec(spec)) available under its disease name"""
+    MODEL_CLASSES[model_class.disease] = model_class
+    return model_class
+
+
+def artifact_signature(model):
+    """Return (path, mtime) pairs for the files backing a loaded model"""
+    signature = []
+    for path in model.artifact_paths():
+        try:
+            signature.append((path, os.stat(path).st_mtime_ns))
+        except OSError:
+            signature.append((path, None))
+    return tuple(signature)
+
+
+class ModelNotReady(RuntimeError):
+    """A model was requested before warm-up loaded it, and the caller may not train it"""
+
+
+# Warm-up states reported by ModelRegistry.status()
+PENDING, LOADING, TRAINING, READY, FAILED = 'pending', 'loading', 'training', 'ready', 'failed'
+
+
+class ModelRegistry:
+    """Keeps one loaded instance per disease for the whole process.
+
+    Models are loaded lazily on first use, or all at once by warm_up().
+    Every lookup compares the modification times of the model's artifact
+    files with the ones seen at load time, so retraining (in this or
+    another process) is picked up on the next request without restarting
+    the app. retrain() trains a new version on a background worker while
+    the current one keeps serving.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._load_locks = {}
+        self._backends = {}
+        self._status = {}
+        self._warm_up_thread = None
+        self._warmed_up = threading.Event()
+        self._retrain_executor = None
+
+    def _load_lock(self, disease):
+        with self._lock:
+            return self._load_locks.setdefault(disease, threading.Lock())
+
+    def get(self, disease, train=True):
+        """Return the loaded model for a disease, loading it if needed.
+
+        When no trained model is saved it is trained, unless train is
+        False, in which case ModelNotReady is raised. With train False the
+        call never waits for another thread's load or training: it serves
+        the previously loaded version if there is one, else raises
+        ModelNotReady.
+        """
+        entry = self._entries.get(disease)
+        if entry is not None and entry[1] == artifact_signature(entry[0]):
+            return entry[0]
+
+        lock = self._load_lock(disease)
+        if not lock.acquire(blocking=train):
+            if entry is not None:
+                return entry[0]
+            raise ModelNotReady(f"The {disease} model is still warming up")
+        try:
+            # Another thread may have finished loading while we waited
+            entry = self._entries.get(disease)
+            if entry is not None and entry[1] == artifact_signature(entry[0]):
+                return entry[0]
+
+            model = get_model_class(disease)()
+            if disease in self._backends:
+                model.backend = self._backends[disease]
+            # A reload after retraining keeps the model reported as ready
+            warming = self._status.get(disease, {}).get('state') != READY
+            if warming:
+                self._set_status(disease, LOADING)
+            if not model.load_model():
+                if not train:
+                    raise ModelNotReady(f"No trained {disease} model is available yet")
+                if warming:
+                    self._set_status(disease, TRAINING)
+                model.train()
+            with self._lock:
+                self._entries[disease] = (model, artifact_signature(model))
+            return model
+        finally:
+            lock.release()
+
+    def _set_status(self, disease, state, **details):
+        with self._lock:
+            self._status[disease] = {'state': state, **details}
+
+    def warm_up(self, diseases=None, train_missing=True):
+        """Load (or train, if allowed) each model and run a dummy prediction through it.
+
+        The prediction primes everything the first real request would
+        otherwise pay for. A failure is recorded in status() and does not
+        stop the other models from warming up.
+        """
+        for disease in diseases or list(MODEL_CLASSES):
+            start = time.perf_counter()
+            try:
+                model = self.get(disease, train=train_missing)
+                trained = self._status.get(disease, {}).get('state') == TRAINING
+                row = [[0.0] * len(model.get_feature_names())]
+                prediction, probability = model.predict(row)
+                model.get_recommendations(prediction, probability, row)
+            except Exception as e:
+                self._set_status(disease, FAILED, error=str(e), seconds=time.perf_counter() - start)
+            else:
+                self._set_status(disease, READY, trained=trained, seconds=time.perf_counter() - start)
+        self._warmed_up.set()
+        return self.status()
+
+    def start_warm_up(self, diseases=None, train_missing=True):
+        """Run warm_up() on a background thread (once per process) and return the thread"""
+        with self._lock:
+            if self._warm_up_thread is None:
+                self._warm_up_thread = threading.Thread(
+                    target=self.warm_up, args=(diseases, train_missing), name='model-warm-up', daemon=True
+                )
+                self._warm_up_thread.start()
+            return self._warm_up_thread
+
+    def wait_ready(self, timeout=None):
+        """Block until warm-up has finished; returns False on timeout"""
+        return self._warmed_up.wait(timeout)
+
+    def status(self):
+        """Return {disease: {'state': ..., ...}} for every registered disease"""
+        with self._lock:
+            return {disease: dict(self._status.get(disease, {'state': PENDING})) for disease in MODEL_CLASSES}
+
+    def is_ready(self, disease=None):
+        """True once the disease (or, by default, every disease) has been warmed up"""
+        with self._lock:
+            diseases = [disease] if disease is not None else list(MODEL_CLASSES)
+            return all(self._status.get(name, {}).get('state') == READY for name in diseases)
+
+    def retrain(self, disease, data_path=None, config=None):
+        """Train a new version of a model on a background worker and return its Future.
+
+        The new model is trained on its own instance and published
+        atomically, so requests keep using the loaded version until then
+        (and in-flight ones finish on it). The future's result is the newly
+        loaded model.
+        """
+        with self._lock:
+            if self._retrain_executor is None:
+                self._retrain_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='model-retrain')
+        return self._retrain_executor.submit(self._retrain, disease, data_path, config)
+
+    def _retrain(self, disease, data_path, config):
+        model = get_model_class(disease)()
+        if disease in self._backends:
+            model.backend = self._backends[disease]
+        model.train(data_path, config=config)
+        return self.get(disease)
+
+    def set_backend(self, disease, backend):
+        """Select the inference backend ('sklearn' or 'compiled') for a disease"""
+        self._backends[disease] = backend
+        entry = self._entries.get(disease)
+        if entry is not None:
+            entry[0].set_backend(backend)
+
+    def reload(self, disease=None):
+        """Force the given disease (or every loaded disease) to be reloaded"""
+        diseases = [disease] if disease is not None else list(self._entries)
+        for name in diseases:
+            with self._load_lock(name):
+                with self._lock:
+                    self._entries.pop(name, None)
+        return [self.get(name) for name in diseases]
+
+    def loaded(self):
+        """Return the names of the diseases currently held in memory"""
+        return sorted(self._entries)
+
+
+registry = ModelRegistry()
+
+
+def get_model(disease, train=True):
+    """Return the shared model instance for a disease"""
+    return registry.get(disease, train)
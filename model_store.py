@@ -0,0 +1,139 @@
+"""
+Versioned on-disk store for one disease's trained model files
+
+Each training run writes a complete set of files (model, scaler, encoders
+and the inference artifact) into its own version directory, and only then
+points the store at it:
+
+    saved_models/<disease>/
+        CURRENT                   name of the version being served
+        versions/<version>/       one complete artifact set per version
+        .staging-<version>-<id>/  a set still being written
+
+A version's files are never replaced once complete. A set that must not
+reuse an existing name (a forced retrain of the same fingerprint) is
+written under unused(name), which is the name itself or the name plus a
+unique suffix; latest(name) finds the newest of these.
+
+The files are written into a staging directory, which is renamed into
+versions/ once complete; publish() then replaces CURRENT with os.replace.
+Both renames are atomic, so a reader that follows CURRENT always finds a
+complete, matching set. Readers that already loaded an older version keep
+using it: its files are only removed by prune(), and memory-mapped
+artifacts stay valid after their file is unlinked.
+"""
+
+import os
+import shutil
+import time
+import uuid
+from contextlib import contextmanager
+
+POINTER_NAME = 'CURRENT'
+VERSIONS_DIR = 'versions'
+STAGING_PREFIX = '.staging-'
+DEFAULT_KEEP = 3
+
+
+class VersionExists(FileExistsError):
+    """Another writer completed the staged version first"""
+
+
+def new_version():
+    """A unique, time-ordered version name"""
+    return f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+
+
+class ModelStore:
+    """The version directories and CURRENT pointer under one root directory"""
+
+    def __init__(self, root):
+        self.root = root
+        self.pointer_path = os.path.join(root, POINTER_NAME)
+
+    def path(self, version):
+        """Directory holding the files of a version"""
+        return os.path.join(self.root, VERSIONS_DIR, version)
+
+    def current(self):
+        """Return the published version, or None if nothing has been published"""
+        try:
+            with open(self.pointer_path) as f:
+                version = f.read().strip()
+        except FileNotFoundError:
+            return None
+        return version if version and self.has(version) else None
+
+    def versions(self):
+        """Complete versions on disk, oldest first"""
+        directory = os.path.join(self.root, VERSIONS_DIR)
+        try:
+            names = os.listdir(directory)
+        except FileNotFoundError:
+            return []
+        return sorted(names, key=lambda name: os.stat(os.path.join(directory, name)).st_mtime_ns)
+
+    @contextmanager
+    def stage(self, version=None):
+        """Yield (version, directory) to write a new artifact set into.
+
+        When the block finishes the directory is moved into versions/ in
+        one rename; if it raises, the partial set is deleted. If another
+        writer completed the same version first, that set is kept, this one
+        is discarded and VersionExists is raised. The version is not served
+        until publish() is called.
+        """
+        version = version or new_version()
+        staging = os.path.join(self.root, f'{STAGING_PREFIX}{version}-{uuid.uuid4().hex[:8]}')
+        os.makedirs(staging)
+        try:
+            yield version, staging
+            os.makedirs(os.path.join(self.root, VERSIONS_DIR), exist_ok=True)
+            try:
+                os.rename(staging, self.path(version))
+            except OSError:
+                if not self.has(version):
+                    raise
+                raise VersionExists(f"Version {version} in {self.root} already exists") from None
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+    def has(self, version):
+        """True if a complete set for version is on disk"""
+        return os.path.isdir(self.path(version))
+
+    def unused(self, version):
+        """version if no set has that name yet, else version with a unique suffix"""
+        return f'{version}-{uuid.uuid4().hex[:8]}' if self.has(version) else version
+
+    def latest(self, version):
+        """The newest complete set named version or version-<suffix>, or None"""
+        matching = [name for name in self.versions() if name == version or name.startswith(f'{version}-')]
+        return matching[-1] if matching else None
+
+    def publish(self, version):
+        """Atomically point CURRENT at a complete version"""
+        if not self.has(version):
+            raise FileNotFoundError(f"No version {version} in {self.root}")
+        # Republishing an older version makes it the newest as far as prune() is concerned
+        os.utime(self.path(version))
+        # Unique per call: threads of one process publish concurrently too
+        tmp_path = f'{self.pointer_path}.{uuid.uuid4().hex}.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                f.write(version + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.pointer_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def prune(self, keep=DEFAULT_KEEP):
+        """Delete all but the newest keep versions; the published one is always kept"""
+        current = self.current()
+        old = [version for version in self.versions() if version != current]
+        for version in old[:max(0, len(old) - max(0, keep - 1))]:
+            shutil.rmtree(self.path(version), ignore_errors=True)
@@ -0,0 +1,107 @@
+"""
+Process-wide cache of prediction results keyed on the exact input vector
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from .instrumentation import timed
+from .model_registry import artifact_signature
+
+DEFAULT_MAXSIZE = 4096
+DEFAULT_TTL = 15 * 60  # seconds
+
+
+class PredictionCache:
+    """A thread-safe LRU cache with a size bound and a time-to-live.
+
+    Entries are keyed on the disease, the version of the loaded model and
+    a canonical hash of the feature vector, so results are shared between
+    sessions but never outlive the model that produced them.
+    """
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, ttl=DEFAULT_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(disease, version, input_data):
+        """Hash a feature vector so equal values give equal keys whatever their input type"""
+        import numpy as np
+
+        values = np.ascontiguousarray(input_data, dtype=np.float64) + 0.0  # folds -0.0 into 0.0
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f'{disease}|{version}|{values.shape}'.encode())
+        digest.update(values.tobytes())
+        return digest.hexdigest()
+
+    def get(self, key):
+        """Return the cached value for key, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.ttl:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """Return hit/miss counters and the current size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'ttl': self.ttl
+            }
+
+
+# The cache used when cached_predict() is not given one
+default_cache = PredictionCache()
+
+
+def model_version(model):
+    """Identify the trained model a result came from: backend plus artifact mtimes"""
+    return (model.backend, artifact_signature(model))
+
+
+def cached_predict(model, input_data, cache=None):
+    """Return (prediction, probability, recommendations), reusing a cached result when possible.
+
+    Cached results are shared between callers and must not be modified.
+    """
+    cache = cache or default_cache
+    key = cache.make_key(model.disease, model_version(model), input_data)
+    result = cache.get(key)
+    if result is None:
+        with timed('cache_miss', model.disease):
+            prediction, probability = model.predict(input_data)
+            recommendations = model.get_recommendations(prediction, probability, input_data)
+        result = (prediction, probability, recommendations)
+        cache.put(key, result)
+    return result
@@ -0,0 +1,69 @@
+"""
+Helpers shared by the disease models for batch prediction
+"""
+
+import sys
+
+import numpy as np
+
+DEFAULT_DECISION_THRESHOLD = 0.5
+
+
+def is_dataframe(X):
+    """True for a pandas DataFrame; never imports pandas (if it isn't loaded, X can't be one)"""
+    pd = sys.modules.get('pandas')
+    return pd is not None and isinstance(X, pd.DataFrame)
+
+
+def to_feature_array(X, feature_names):
+    """Return X as a 2-D float array with columns in feature_names order.
+
+    DataFrames are reordered by column name; arrays must already be in
+    feature order.
+    """
+    if is_dataframe(X):
+        missing = [col for col in feature_names if col not in X.columns]
+        if missing:
+            raise ValueError(f"Missing feature columns: {', '.join(missing)}")
+        X = X[feature_names].to_numpy(dtype=float, na_value=np.nan)
+    else:
+        X = np.asarray(X, dtype=float)
+
+    if X.ndim != 2 or X.shape[1] != len(feature_names):
+        raise ValueError(
+            f"Expected a 2-D input with {len(feature_names)} feature columns, got shape {X.shape}"
+        )
+    return X
+
+
+def labels_from_proba(probabilities, classes, threshold=DEFAULT_DECISION_THRESHOLD):
+    """Derive class labels from predict_proba output and a decision threshold.
+
+    A binary model predicts classes[1] when its probability is strictly
+    above threshold, so the default of 0.5 reproduces argmax (a tie goes to
+    classes[0]). A single-class model always predicts its one class, and
+    models with more than two classes use argmax.
+    """
+    classes = np.asarray(classes)
+    probabilities = np.asarray(probabilities)
+    if len(classes) == 2:
+        return np.where(probabilities[:, 1] > threshold, classes[1], classes[0])
+    return classes.take(np.argmax(probabilities, axis=1), axis=0)
+
+
+def risk_scores(predictions, probabilities):
+    """Vectorized version of the risk score computed in get_recommendations"""
+    probabilities = np.asarray(probabilities)
+    if probabilities.shape[1] > 1:
+        return probabilities[:, 1] * 100  # Probability of class 1 (high risk)
+    # Single-class model: the only column is the probability of the predicted class
+    return np.where(np.asarray(predictions) == 1, probabilities[:, 0] * 100, (1 - probabilities[:, 0]) * 100)
+
+
+def recommendations_batch(predictions, probabilities):
+    """Return risk scores and risk levels for a batch of predictions"""
+    predictions = np.asarray(predictions)
+    return {
+        'risk_score': risk_scores(predictions, probabilities),
+        'risk_level': np.where(predictions == 1, 'High Risk', 'Low Risk')
+    }
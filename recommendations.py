@@ -0,0 +1,501 @@
+"""
+Precomputed recommendation tables for the disease models
+
+Every entry is built once, at import, from tuples and wrapped in
+MappingProxyType, so get_recommendations() only looks entries up and all
+callers share the same read-only objects. Entries are keyed by
+(disease, risk level, sub-condition). The sub-condition is None except for
+heart disease ('breathing' or 'stable' at high risk, 'fit' or 'improvable'
+at low risk) and hypertension (the blood pressure stage).
+"""
+
+from types import MappingProxyType
+
+HIGH_RISK = 'High Risk'
+LOW_RISK = 'Low Risk'
+
+
+def _entry(risk_level, immediate_actions, lifestyle_changes, medical_advice, prevention_tips):
+    return MappingProxyType({
+        'risk_level': risk_level,
+        'immediate_actions': immediate_actions,
+        'lifestyle_changes': lifestyle_changes,
+        'medical_advice': medical_advice,
+        'prevention_tips': prevention_tips
+    })
+
+
+# Diabetes
+_DIABETES_HIGH = _entry(
+    HIGH_RISK,
+    immediate_actions=(
+        '🚨 Consult with a doctor immediately for comprehensive diabetes screening',
+        '🩺 Schedule an appointment with an endocrinologist',
+        '📊 Get a complete blood sugar profile (HbA1c, Fasting, Post-prandial)',
+        '👁️ Get your eyes checked for diabetic retinopathy risk'
+    ),
+    lifestyle_changes=(
+        '🥗 Adopt a low-glycemic index diet immediately',
+        '🏃 Start moderate exercise (30 minutes daily walking)',
+        '⚖️ Monitor and reduce body weight if BMI is high',
+        '🚭 Quit smoking if you smoke',
+        '💧 Stay well-hydrated (8-10 glasses of water daily)',
+        '😴 Ensure 7-8 hours of quality sleep'
+    ),
+    medical_advice=(
+        'Monitor blood glucose levels regularly',
+        'Consider diabetes management program',
+        'Check for complications (kidney function, nerve damage)',
+        'Discuss medication options with your doctor'
+    ),
+    prevention_tips=(
+        'Track your carbohydrate intake',
+        'Avoid sugary drinks and processed foods',
+        'Manage stress through meditation or yoga',
+        'Regular health check-ups every 3 months'
+    )
+)
+
+_DIABETES_LOW = _entry(
+    LOW_RISK,
+    immediate_actions=(
+        '✅ Your current diabetes risk appears low',
+        '📋 Continue regular health monitoring',
+        '🎯 Maintain your current healthy lifestyle'
+    ),
+    lifestyle_changes=(
+        '🥗 Continue balanced diet with whole grains and vegetables',
+        '🏃 Maintain regular physical activity (150 minutes/week)',
+        '⚖️ Keep body weight in healthy range',
+        '💧 Stay hydrated throughout the day',
+        '😴 Maintain good sleep hygiene'
+    ),
+    medical_advice=(
+        'Get annual diabetes screening after age 45',
+        'Monitor if you have family history of diabetes',
+        'Regular check-ups with your primary care physician'
+    ),
+    prevention_tips=(
+        'Limit refined sugar and processed foods',
+        'Include fiber-rich foods in diet',
+        'Practice stress management',
+        'Stay aware of diabetes symptoms'
+    )
+)
+
+# Kidney
+_KIDNEY_HIGH = _entry(
+    HIGH_RISK,
+    immediate_actions=(
+        '🚨 Consult a nephrologist (kidney specialist) immediately',
+        '🩺 Get comprehensive kidney function tests (Creatinine, BUN, GFR)',
+        '🔬 Complete urinalysis and urine protein test',
+        '📊 Get ultrasound of kidneys and urinary tract',
+        '💊 Review all current medications with your doctor',
+        '📋 Check for diabetes and hypertension complications'
+    ),
+    lifestyle_changes=(
+        '💧 Increase water intake (8-10 glasses daily)',
+        '🧂 Reduce sodium intake significantly (less than 2000mg/day)',
+        '🥩 Limit protein intake as advised by doctor',
+        '🚭 Quit smoking immediately',
+        '🍷 Avoid alcohol consumption',
+        '⚖️ Maintain healthy body weight',
+        '🏃 Engage in light to moderate exercise',
+        '😴 Get adequate rest (7-8 hours)'
+    ),
+    medical_advice=(
+        'Monitor blood pressure daily',
+        'Regular kidney function monitoring (every 1-3 months)',
+        'Discuss dialysis options if kidney function is very low',
+        'Consider kidney transplant evaluation if needed',
+        'Manage underlying conditions (diabetes, hypertension)',
+        'Avoid NSAIDs and nephrotoxic medications',
+        'Get vaccinated (flu, pneumonia vaccines)'
+    ),
+    prevention_tips=(
+        'Avoid foods high in potassium and phosphorus if advised',
+        'Monitor fluid intake carefully',
+        'Keep track of urine output',
+        'Watch for swelling in legs, ankles, or face',
+        'Be alert for symptoms: fatigue, nausea, confusion',
+        'Maintain a kidney-friendly diet plan'
+    )
+)
+
+_KIDNEY_LOW = _entry(
+    LOW_RISK,
+    immediate_actions=(
+        '✅ Your kidney function appears healthy',
+        '📋 Continue regular health monitoring',
+        '🎯 Maintain protective lifestyle habits',
+        '💧 Keep up good hydration'
+    ),
+    lifestyle_changes=(
+        '💧 Drink adequate water (6-8 glasses daily)',
+        '🥗 Eat balanced diet with fruits and vegetables',
+        '🧂 Use salt moderately',
+        '🏃 Maintain regular physical activity',
+        '⚖️ Keep healthy body weight',
+        '😴 Get quality sleep',
+        '🧘 Manage stress effectively'
+    ),
+    medical_advice=(
+        'Annual kidney function screening after age 50',
+        'Monitor if you have diabetes or hypertension',
+        'Regular blood pressure checks',
+        'Discuss family history with your doctor',
+        'Get baseline kidney tests as recommended'
+    ),
+    prevention_tips=(
+        'Stay well-hydrated throughout the day',
+        'Limit processed and high-sodium foods',
+        'Avoid excessive use of pain medications',
+        'Control blood sugar and blood pressure',
+        'Avoid smoking and excessive alcohol',
+        'Be aware of kidney disease symptoms'
+    )
+)
+
+# Stroke
+_STROKE_HIGH = _entry(
+    HIGH_RISK,
+    immediate_actions=(
+        '🚨 Seek immediate medical consultation with a neurologist',
+        '🏥 Get brain MRI/CT scan to assess current brain health',
+        '🩺 Complete cardiovascular and neurological examination',
+        '📊 Check blood pressure, cholesterol, and blood sugar levels',
+        '💊 Discuss antiplatelet or anticoagulant therapy with doctor',
+        '🚑 Learn F.A.S.T. stroke warning signs (Face, Arms, Speech, Time)'
+    ),
+    lifestyle_changes=(
+        '🚭 Quit smoking immediately - major stroke risk factor',
+        '🍷 Eliminate or severely limit alcohol consumption',
+        '🥗 Adopt DASH or Mediterranean diet',
+        '🧂 Reduce sodium to less than 1500mg per day',
+        '⚖️ Achieve and maintain healthy weight',
+        '🏃 Start supervised exercise program (30 min, 5 days/week)',
+        '😴 Ensure 7-8 hours of quality sleep',
+        '🧘 Practice stress reduction techniques daily'
+    ),
+    medical_advice=(
+        'Monitor blood pressure at least twice daily',
+        'Control cholesterol with medication if needed',
+        'Manage diabetes strictly if diabetic',
+        'Consider carotid artery screening',
+        'Regular neurological assessments',
+        'Discuss aspirin therapy or other blood thinners',
+        'Get cardiac evaluation to rule out atrial fibrillation',
+        'Follow up every 1-2 months initially'
+    ),
+    prevention_tips=(
+        'Learn and memorize stroke warning signs: F.A.S.T.',
+        'Keep emergency contacts readily available',
+        'Avoid strenuous activities until cleared by doctor',
+        'Monitor for symptoms: sudden numbness, confusion, vision problems',
+        'Stay compliant with all prescribed medications',
+        'Avoid extreme temperature changes',
+        'Consider medical alert device'
+    )
+)
+
+_STROKE_LOW = _entry(
+    LOW_RISK,
+    immediate_actions=(
+        '✅ Your stroke risk appears low currently',
+        '📋 Maintain regular health check-ups',
+        '🎯 Continue healthy lifestyle practices',
+        '📚 Stay informed about stroke prevention'
+    ),
+    lifestyle_changes=(
+        '🥗 Maintain heart-healthy diet',
+        '🏃 Continue regular physical activity (150 min/week)',
+        '🚭 Stay tobacco-free',
+        '🍷 Limit alcohol consumption',
+        '⚖️ Maintain healthy weight',
+        '💧 Stay well-hydrated',
+        '😴 Keep consistent sleep schedule',
+        '🧘 Manage stress effectively'
+    ),
+    medical_advice=(
+        'Annual health screenings after age 55',
+        'Monitor blood pressure regularly',
+        'Check cholesterol levels yearly',
+        'Control blood sugar if diabetic or prediabetic',
+        'Discuss family history with your doctor',
+        'Get baseline cardiovascular assessment'
+    ),
+    prevention_tips=(
+        'Learn F.A.S.T. stroke warning signs',
+        'Control blood pressure (keep below 120/80)',
+        'Stay physically and mentally active',
+        'Limit saturated fats and trans fats',
+        'Eat foods rich in potassium and fiber',
+        'Be aware of stroke symptoms in your family history'
+    )
+)
+
+# Heart disease: status and breathing notes per band of max heart rate reached
+HEART_RATE_BANDS = MappingProxyType({
+    'good': ('Normal - Good cardiovascular fitness', 'Normal breathing capacity'),
+    'moderate': ('Moderate - Regular monitoring recommended', 'Adequate breathing, could improve with exercise'),
+    'low': ('Below optimal - Needs attention', 'May indicate breathing difficulties or poor cardiovascular fitness')
+})
+
+_HEART_HIGH_SHARED = {
+    'lifestyle_changes': (
+        '🥗 Start heart-healthy diet (Mediterranean or DASH diet)',
+        '🧂 Reduce sodium intake to less than 2000mg per day',
+        '🏃 Begin supervised cardiac rehabilitation program',
+        '🚭 Quit smoking immediately if you smoke',
+        '🍷 Limit alcohol consumption',
+        '⚖️ Work on achieving healthy weight',
+        '😴 Ensure 7-8 hours quality sleep',
+        '🧘 Practice stress reduction (meditation, deep breathing)'
+    ),
+    'medical_advice': (
+        'Consider aspirin therapy (consult doctor first)',
+        'Monitor blood pressure daily',
+        'Get cholesterol levels checked regularly',
+        'Discuss statin therapy if cholesterol is high',
+        'Regular follow-ups every 2-4 weeks initially',
+        'Consider cardiac CT or angiography if recommended'
+    ),
+    'prevention_tips': (
+        'Learn CPR and warning signs of heart attack',
+        'Keep nitroglycerin available if prescribed',
+        'Avoid strenuous activities until cleared by doctor',
+        'Track symptoms daily (chest pain, breathing, fatigue)',
+        'Monitor heart rate and blood pressure',
+        'Avoid extreme temperatures'
+    )
+}
+
+_HEART_HIGH_BREATHING = _entry(
+    HIGH_RISK,
+    immediate_actions=(
+        '🚨 URGENT: Consult a cardiologist immediately - you may have breathing difficulties',
+        '🏥 Visit emergency room if experiencing chest pain or severe shortness of breath',
+        '📞 Keep emergency contacts handy',
+        '🩺 Get ECG, Echocardiogram, and stress test done urgently',
+        '💊 Discuss immediate medication options with your doctor',
+        '🚑 Do NOT ignore symptoms like breathing problems, chest discomfort, or fatigue'
+    ),
+    **_HEART_HIGH_SHARED
+)
+
+_HEART_HIGH_STABLE = _entry(
+    HIGH_RISK,
+    immediate_actions=(
+        '🚨 Schedule urgent appointment with cardiologist',
+        '🩺 Get comprehensive cardiac evaluation (ECG, Echo, Stress Test)',
+        '📊 Complete lipid profile and cardiac markers test',
+        '💊 Discuss preventive medication with your doctor'
+    ),
+    **_HEART_HIGH_SHARED
+)
+
+_HEART_LOW_SHARED = {
+    'lifestyle_changes': (
+        '🥗 Maintain balanced diet rich in fruits, vegetables, whole grains',
+        '🏃 Continue regular aerobic exercise (150 minutes/week)',
+        '🧂 Keep sodium intake moderate',
+        '⚖️ Maintain healthy weight',
+        '💧 Stay well-hydrated',
+        '😴 Maintain consistent sleep schedule',
+        '🧘 Practice stress management techniques'
+    ),
+    'medical_advice': (
+        'Annual cardiac check-up after age 40',
+        'Monitor blood pressure and cholesterol yearly',
+        'Discuss family history with your doctor',
+        'Get baseline cardiac tests as recommended'
+    ),
+    'prevention_tips': (
+        'Continue heart-healthy habits',
+        'Stay aware of cardiac symptoms',
+        'Avoid smoking and excessive alcohol',
+        'Manage stress effectively',
+        'Stay physically active',
+        'Monitor changes in energy levels or breathing'
+    )
+}
+
+_HEART_LOW_FIT = _entry(
+    LOW_RISK,
+    immediate_actions=(
+        '✅ Excellent! Your heart rate indicates good cardiovascular fitness',
+        '🎯 Continue your current healthy lifestyle',
+        '📋 Regular annual check-ups recommended',
+        '💪 Maintain your exercise routine for optimal heart health'
+    ),
+    **_HEART_LOW_SHARED
+)
+
+_HEART_LOW_IMPROVABLE = _entry(
+    LOW_RISK,
+    immediate_actions=(
+        '✅ Your heart disease risk is currently low',
+        '📊 Your heart rate could be improved with regular exercise',
+        '🏃 Gradually increase cardiovascular exercise intensity',
+        '📋 Continue regular health monitoring'
+    ),
+    **_HEART_LOW_SHARED
+)
+
+# Hypertension: status and category per systolic blood pressure stage
+BP_STAGES = MappingProxyType({
+    'normal': ('Normal', 'Optimal blood pressure'),
+    'elevated': ('Elevated', 'Pre-hypertension - needs attention'),
+    'stage_1': ('Stage 1 Hypertension', 'High blood pressure - medical intervention needed'),
+    'stage_2': ('Stage 2 Hypertension', 'Very high blood pressure - urgent medical attention')
+})
+
+_HYPERTENSION_HIGH_SHARED = {
+    'lifestyle_changes': (
+        '🧂 Reduce sodium intake to less than 1500mg per day',
+        '🥗 Adopt DASH diet (Dietary Approaches to Stop Hypertension)',
+        '⚖️ Lose weight if overweight (even 5-10 lbs helps)',
+        '🏃 Exercise regularly (30 minutes, most days)',
+        '🚭 Quit smoking immediately',
+        '🍷 Limit alcohol (max 1-2 drinks per day)',
+        '☕ Reduce caffeine intake',
+        '😴 Get 7-9 hours of quality sleep',
+        '🧘 Practice stress management daily'
+    ),
+    'medical_advice': (
+        'Monitor blood pressure at home twice daily',
+        'Keep a blood pressure log',
+        'Take medications exactly as prescribed',
+        'Regular follow-ups every 2-4 weeks initially',
+        'Watch for hypertension complications (kidney, eye, heart)',
+        'Get regular kidney function tests',
+        'Screen for secondary causes of hypertension',
+        'Consider home blood pressure monitor'
+    ),
+    'prevention_tips': (
+        'Learn proper blood pressure measurement technique',
+        'Avoid high-sodium processed foods',
+        'Increase potassium-rich foods (bananas, spinach)',
+        'Eat dark chocolate (70%+ cocoa) in moderation',
+        'Practice deep breathing exercises',
+        'Avoid sudden position changes',
+        'Monitor for symptoms: headaches, dizziness, chest pain'
+    )
+}
+
+_HYPERTENSION_HIGH_STAGE_2 = _entry(
+    HIGH_RISK,
+    immediate_actions=(
+        '🚨 URGENT: Consult your doctor immediately - you have Stage 2 Hypertension',
+        '🏥 Get comprehensive cardiovascular evaluation',
+        '📊 24-hour ambulatory blood pressure monitoring',
+        '💊 Discuss immediate medication options',
+        '🔬 Complete blood work (kidney function, electrolytes)',
+        '🩺 ECG and echocardiogram to check heart health'
+    ),
+    **_HYPERTENSION_HIGH_SHARED
+)
+
+_HYPERTENSION_HIGH = _entry(
+    HIGH_RISK,
+    immediate_actions=(
+        '🚨 Schedule appointment with your doctor urgently',
+        '📊 Start monitoring blood pressure twice daily',
+        '🩺 Get complete cardiovascular health assessment',
+        '🔬 Blood tests for kidney function and cholesterol',
+        '💊 Discuss preventive medication with doctor'
+    ),
+    **_HYPERTENSION_HIGH_SHARED
+)
+
+_HYPERTENSION_LOW_SHARED = {
+    'lifestyle_changes': (
+        '🥗 Maintain balanced, low-sodium diet',
+        '🏃 Continue regular physical activity',
+        '⚖️ Maintain healthy body weight',
+        '🚭 Stay tobacco-free',
+        '🍷 Moderate alcohol consumption',
+        '😴 Keep consistent sleep schedule',
+        '🧘 Practice stress management',
+        '💧 Stay well-hydrated'
+    ),
+    'medical_advice': (
+        'Check blood pressure annually',
+        'Monitor more frequently if family history exists',
+        'Know your baseline blood pressure',
+        'Discuss risk factors with your doctor',
+        'Get cardiovascular screening as recommended'
+    ),
+    'prevention_tips': (
+        'Keep sodium intake below 2300mg daily',
+        'Eat plenty of fruits and vegetables',
+        'Choose whole grains over refined grains',
+        'Limit saturated and trans fats',
+        'Stay physically active',
+        'Maintain healthy weight',
+        'Manage stress effectively'
+    )
+}
+
+_HYPERTENSION_LOW_RAISED = _entry(
+    LOW_RISK,
+    immediate_actions=(
+        '⚠️ Your blood pressure is elevated - take preventive action now',
+        '📊 Start monitoring blood pressure regularly',
+        '🥗 Begin lifestyle modifications immediately',
+        '👨\u200d⚕️ Discuss with your doctor at next visit'
+    ),
+    **_HYPERTENSION_LOW_SHARED
+)
+
+_HYPERTENSION_LOW = _entry(
+    LOW_RISK,
+    immediate_actions=(
+        '✅ Your blood pressure and hypertension risk are currently low',
+        '📋 Continue healthy lifestyle habits',
+        '🎯 Maintain regular health monitoring',
+        '💪 Keep up the good work!'
+    ),
+    **_HYPERTENSION_LOW_SHARED
+)
+
+_TABLE = {
+    ('diabetes', HIGH_RISK, None): _DIABETES_HIGH,
+    ('diabetes', LOW_RISK, None): _DIABETES_LOW,
+    ('kidney', HIGH_RISK, None): _KIDNEY_HIGH,
+    ('kidney', LOW_RISK, None): _KIDNEY_LOW,
+    ('stroke', HIGH_RISK, None): _STROKE_HIGH,
+    ('stroke', LOW_RISK, None): _STROKE_LOW,
+    ('heart', HIGH_RISK, 'breathing'): _HEART_HIGH_BREATHING,
+    ('heart', HIGH_RISK, 'stable'): _HEART_HIGH_STABLE,
+    ('heart', LOW_RISK, 'fit'): _HEART_LOW_FIT,
+    ('heart', LOW_RISK, 'improvable'): _HEART_LOW_IMPROVABLE,
+    ('hypertension', HIGH_RISK, 'normal'): _HYPERTENSION_HIGH,
+    ('hypertension', HIGH_RISK, 'elevated'): _HYPERTENSION_HIGH,
+    ('hypertension', HIGH_RISK, 'stage_1'): _HYPERTENSION_HIGH,
+    ('hypertension', HIGH_RISK, 'stage_2'): _HYPERTENSION_HIGH_STAGE_2,
+    ('hypertension', LOW_RISK, 'normal'): _HYPERTENSION_LOW,
+    ('hypertension', LOW_RISK, 'elevated'): _HYPERTENSION_LOW,
+    ('hypertension', LOW_RISK, 'stage_1'): _HYPERTENSION_LOW_RAISED,
+    ('hypertension', LOW_RISK, 'stage_2'): _HYPERTENSION_LOW_RAISED
+}
+RECOMMENDATIONS = MappingProxyType(_TABLE)
+
+
+def register(disease, risk_level, immediate_actions, lifestyle_changes, medical_advice, prevention_tips,
+             sub_condition=None):
+    """Add the entry for a disease declared outside this module (see base_model.DiseaseSpec)"""
+    _TABLE[(disease, risk_level, sub_condition)] = _entry(
+        risk_level, tuple(immediate_actions), tuple(lifestyle_changes), tuple(medical_advice),
+        tuple(prevention_tips)
+    )
+
+
+def lookup(disease, risk_level, sub_condition=None):
+    """Return the shared, read-only recommendation entry for a result.
+
+    Callers that add per-request fields take entry.copy(): a plain dict
+    whose lists are still the shared tuples.
+    """
+    return RECOMMENDATIONS[(disease, risk_level, sub_condition)]
@@ -0,0 +1,167 @@
+"""
+Headless bulk scoring of patient files
+
+Usage:
+    python -m ml_model.score --disease heart --in patients.parquet --out scored.parquet
+
+The input is streamed in chunks, so memory use depends on --chunksize and
+not on the size of the file. CSV and Parquet are supported for both input
+and output (Parquet needs pyarrow). Columns the model knows are read with
+the model's dtypes, widened to hold missing values, so every chunk has the
+same column types and the Parquet output one schema.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+from .model_registry import MODEL_CLASSES, get_model
+
+DEFAULT_CHUNKSIZE = 50_000
+
+
+def _file_format(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext in ('.parquet', '.pq'):
+        return 'parquet'
+    if ext in ('.csv', '.txt'):
+        return 'csv'
+    raise ValueError(f"Unsupported file type '{ext}' for {path}. Use .csv or .parquet")
+
+
+def _import_parquet():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Parquet files need pyarrow. Install it with: pip install pyarrow") from None
+    return pa, pq
+
+
+def iter_chunks(path, chunksize=DEFAULT_CHUNKSIZE, dtype=None):
+    """Yield DataFrames of at most chunksize rows from a CSV or Parquet file.
+
+    dtype optionally maps column names to the dtypes to read them as.
+    """
+    if _file_format(path) == 'parquet':
+        _, pq = _import_parquet()
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+            df = batch.to_pandas()
+            yield df.astype({col: t for col, t in dtype.items() if col in df}) if dtype else df
+    else:
+        yield from pd.read_csv(path, chunksize=chunksize, dtype=dtype)
+
+
+def scoring_dtypes(schema):
+    """Dtypes to read a model's columns with when any value may be missing.
+
+    Integer columns become pandas' nullable integers and categorical
+    columns strings, so a chunk with (or without) gaps is typed like the
+    others instead of pandas inferring int64 for one and float64 for the next.
+    """
+    dtypes = {}
+    for col, dtype in schema.items():
+        dtype = pd.api.types.pandas_dtype(dtype)
+        if isinstance(dtype, pd.CategoricalDtype):
+            dtypes[col] = 'str'
+        elif pd.api.types.is_integer_dtype(dtype):
+            dtypes[col] = dtype.name.capitalize()
+        else:
+            dtypes[col] = dtype
+    return dtypes
+
+
+class ChunkWriter:
+    """Appends scored chunks to a CSV or Parquet file; a failed run leaves no partial file"""
+
+    def __init__(self, path):
+        self.path = path
+        self.format = _file_format(path)
+        self._parquet_writer = None
+        self._started = False
+
+    def write(self, df):
+        if self.format == 'parquet':
+            pa, pq = _import_parquet()
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if self._parquet_writer is None:
+                self._parquet_writer = pq.ParquetWriter(self.path, table.schema)
+            elif table.schema != self._parquet_writer.schema:
+                # Columns outside the model's schema are still inferred per chunk
+                table = table.cast(self._parquet_writer.schema)
+            self._parquet_writer.write_table(table)
+        else:
+            df.to_csv(self.path, mode='a' if self._started else 'w', header=not self._started, index=False)
+        self._started = True
+
+    def close(self):
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        self.close()
+        if exc_type is not None and os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def score_chunk(model, df):
+    """Return df with prediction, probability and risk_level columns added"""
+    predictions, probabilities = model.predict_batch(df)
+    summary = model.get_recommendations_batch(predictions, probabilities)
+
+    scored = df.copy()
+    scored['prediction'] = predictions
+    scored['probability'] = summary['risk_score'] / 100
+    scored['risk_level'] = summary['risk_level']
+    return scored
+
+
+def score_file(disease, in_path, out_path, chunksize=DEFAULT_CHUNKSIZE, verbose=True):
+    """Score every row of in_path with the given disease model and write out_path"""
+    model = get_model(disease)
+
+    rows = 0
+    start = time.perf_counter()
+    with ChunkWriter(out_path) as writer:
+        for chunk in iter_chunks(in_path, chunksize, scoring_dtypes(model.spec.schema)):
+            writer.write(score_chunk(model, chunk))
+            rows += len(chunk)
+            if verbose:
+                elapsed = time.perf_counter() - start
+                print(f"  {rows:,} rows scored ({rows / elapsed:,.0f} rows/s)", file=sys.stderr)
+
+    elapsed = time.perf_counter() - start
+    return {
+        'rows': rows,
+        'seconds': elapsed,
+        'rows_per_second': rows / elapsed if elapsed > 0 else float('inf')
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score a CSV/Parquet patient file with a disease model")
+    parser.add_argument('--disease', required=True, choices=sorted(MODEL_CLASSES))
+    parser.add_argument('--in', dest='in_path', required=True, help="input .csv or .parquet file")
+    parser.add_argument('--out', dest='out_path', required=True, help="output .csv or .parquet file")
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE,
+                        help=f"rows per chunk (default {DEFAULT_CHUNKSIZE:,})")
+    parser.add_argument('--quiet', action='store_true', help="only print the final summary")
+    args = parser.parse_args(argv)
+
+    try:
+        stats = score_file(args.disease, args.in_path, args.out_path, args.chunksize, verbose=not args.quiet)
+    except (ImportError, ValueError) as e:
+        parser.error(str(e))
+    print(f"Scored {stats['rows']:,} rows in {stats['seconds']:.2f}s "
+          f"({stats['rows_per_second']:,.0f} rows/s) -> {args.out_path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""
+Screen one patient for every disease in a single call
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .model_registry import MODEL_CLASSES, ModelNotReady, get_model, get_model_class
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    """Shared pool: tree evaluation releases the GIL, so the models run in parallel"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=len(MODEL_CLASSES), thread_name_prefix='screening')
+        return _executor
+
+
+def get_feature_names(disease):
+    """Return the feature names, in model order, for a disease"""
+    return get_model_class(disease).get_feature_names()
+
+
+def _lookup(record, folded, feature):
+    """Find a feature in the record; the datasets disagree on case (Age/age, BMI/bmi)"""
+    if feature in record:
+        return record[feature]
+    return folded.get(feature.lower())
+
+
+def map_record(record, disease):
+    """Return (row values in the disease's feature order, missing feature names)"""
+    features = get_feature_names(disease)
+    # Keys are matched case-insensitively when there is no exact match
+    folded = {str(key).lower(): value for key, value in record.items()}
+    values = [_lookup(record, folded, feature) for feature in features]
+    missing = [feature for feature, value in zip(features, values) if value is None]
+    return values, missing
+
+
+def _score(disease, values):
+    start = time.perf_counter()
+    # Screening never trains or waits for a load; a model that is not ready raises ModelNotReady
+    model = get_model(disease, train=False)
+    # Categorical columns may arrive as strings and are encoded by the model
+    input_data = model.encode_row(values)
+    prediction, probability = model.predict_array(input_data)
+    recommendations = model.get_recommendations(prediction[0], probability[0], input_data)
+    return {
+        'prediction': prediction[0],
+        'probability': probability[0],
+        'risk_score': recommendations['risk_score'],
+        'risk_level': recommendations['risk_level'],
+        'recommendations': recommendations,
+        'seconds': time.perf_counter() - start
+    }
+
+
+def screen_patient(record, diseases=None):
+    """Evaluate every applicable disease model for one patient record.
+
+    record is a dict holding the union of the models' features (names as in
+    each model's get_feature_names(), matched case-insensitively: 'age' or
+    'AGE' satisfies 'Age', 'Residence_Type' satisfies 'Residence_type').
+    Models whose features are not all present are skipped. The applicable
+    models are evaluated concurrently on a thread pool; a model that fails
+    (on an unknown category, say) is reported under errors, and one that is
+    still warming up or failed to load under not_ready; the others are
+    still returned.
+
+    Returns {'risks': {disease: result}, 'skipped': {disease: [missing features]},
+    'errors': {disease: message}, 'not_ready': {disease: message},
+    'timings': {disease: seconds, ..., 'total': seconds}}.
+    """
+    start = time.perf_counter()
+    diseases = list(diseases or MODEL_CLASSES)
+
+    futures, skipped = {}, {}
+    executor = _get_executor()
+    for disease in diseases:
+        values, missing = map_record(record, disease)
+        if missing:
+            skipped[disease] = missing
+            continue
+        futures[disease] = executor.submit(_score, disease, values)
+
+    risks, errors, not_ready = {}, {}, {}
+    for disease, future in futures.items():
+        try:
+            risks[disease] = future.result()
+        except ModelNotReady as exc:
+            not_ready[disease] = str(exc)
+        except Exception as exc:
+            errors[disease] = str(exc)
+    timings = {disease: result['seconds'] for disease, result in risks.items()}
+    timings['total'] = time.perf_counter() - start
+    return {'risks': risks, 'skipped': skipped, 'errors': errors, 'not_ready': not_ready,
+            'timings': timings}
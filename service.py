@@ -0,0 +1,301 @@
+"""
+Local HTTP inference service with request micro-batching
+
+Usage:
+    python -m ml_model.service [--host 127.0.0.1] [--port 8000] [--window-ms 2] [--max-batch 64]
+        [--metrics]
+
+Endpoints:
+    GET  /health              -> {"status": "ok" | "warming_up", "diseases": [...], "models": {...}}
+    GET  /ready               -> 200 once every model is warmed up, 503 until then
+    GET  /metrics             -> stage timings in Prometheus text format (with --metrics)
+    POST /predict/{disease}   body {"features": [...]} in get_feature_names() order,
+                              or {"features": {"name": value, ...}}
+
+Concurrent single-row requests for the same disease are collected for up
+to --window-ms (or until --max-batch rows are waiting) and scored with one
+batched forest evaluation, then the results are fanned back out. Under
+load this trades at most one window of added latency for far fewer, larger
+forest evaluations. Only the standard library and the model stack are used.
+
+The server accepts connections straight away and warms the models up on a
+background thread: each is loaded (or trained, if nothing is saved yet)
+and given a dummy prediction. Until a model is ready its predict endpoint
+answers 503, so no request ever loads or trains a model itself.
+"""
+
+import argparse
+import asyncio
+import json
+from http import HTTPStatus
+
+import numpy as np
+
+from .instrumentation import enable as enable_metrics, metrics
+from .model_registry import MODEL_CLASSES, READY, get_model, get_model_class, registry
+from .prediction_utils import recommendations_batch
+from .screening import get_feature_names
+
+MAX_BODY_BYTES = 1 << 20
+
+
+class RequestError(Exception):
+    """A client error reported back as an HTTP 4xx response"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class MicroBatcher:
+    """Collects single rows for one disease and scores them in batches"""
+
+    def __init__(self, disease, window_ms=2.0, max_batch=64):
+        self.disease = disease
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+        self.batches = 0
+        self.rows = 0
+        self._pending = []
+        self._timer = None
+
+    async def submit(self, row):
+        """Queue one parsed feature row and wait for its result"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((row, future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            asyncio.get_running_loop().create_task(self._run(batch))
+
+    def _score(self, rows):
+        """Encode and score rows on a worker thread.
+
+        Returns (indices of the rows scored, predictions, probabilities,
+        {index: error} for rows whose category labels are unknown).
+        """
+        model = get_model(self.disease, train=False)
+        if not model.spec.categorical:
+            return list(range(len(rows))), *model.predict_array(np.array(rows, dtype=float)), {}
+        scored, encoded, errors = [], [], {}
+        for i, row in enumerate(rows):
+            try:
+                encoded.append(model.encode_row(row)[0])
+            except ValueError as e:
+                errors[i] = e
+            else:
+                scored.append(i)
+        if not encoded:
+            return [], None, None, errors
+        return scored, *model.predict_array(np.array(encoded)), errors
+
+    async def _run(self, batch):
+        loop = asyncio.get_running_loop()
+        try:
+            # Model lookup, encoding and forest evaluation run off the event
+            # loop, so a reload after a new version is published never stalls it
+            scored, predictions, probabilities, errors = await loop.run_in_executor(
+                None, self._score, [row for row, _ in batch]
+            )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for i, e in errors.items():
+            if not batch[i][1].done():
+                batch[i][1].set_exception(RequestError(HTTPStatus.BAD_REQUEST, str(e)))
+        if not scored:
+            return
+        self.batches += 1
+        self.rows += len(scored)
+        summary = recommendations_batch(predictions, probabilities)
+        for i, index in enumerate(scored):
+            future = batch[index][1]
+            if not future.done():  # the client may have gone away
+                future.set_result({
+                    'disease': self.disease,
+                    'prediction': predictions[i].item(),
+                    'probability': probabilities[i].tolist(),
+                    'risk_score': float(summary['risk_score'][i]),
+                    'risk_level': str(summary['risk_level'][i])
+                })
+
+
+def parse_features(disease, features):
+    """Turn a request's features (list or dict) into a row in model order.
+
+    Numbers become floats. Categorical columns may keep their string labels,
+    which the model encodes with its persisted vocabularies when the batch is
+    scored (see BaseDiseaseModel.encode_row).
+    """
+    names = get_feature_names(disease)
+    categorical = get_model_class(disease).spec.categorical
+    if isinstance(features, dict):
+        missing = [name for name in names if name not in features]
+        if missing:
+            raise RequestError(HTTPStatus.BAD_REQUEST, f"Missing features: {', '.join(missing)}")
+        features = [features[name] for name in names]
+    if not isinstance(features, list) or len(features) != len(names):
+        raise RequestError(HTTPStatus.BAD_REQUEST, f"Expected {len(names)} features: {', '.join(names)}")
+
+    row = []
+    for name, value in zip(names, features):
+        if isinstance(value, str) and name in categorical:
+            row.append(value)
+            continue
+        try:
+            row.append(float(value))
+        except (TypeError, ValueError):
+            raise RequestError(HTTPStatus.BAD_REQUEST, f"Feature {name} must be a number, got {value!r}") from None
+    return row
+
+
+class InferenceService:
+    """Routes HTTP requests to one MicroBatcher per disease"""
+
+    def __init__(self, window_ms=2.0, max_batch=64):
+        self.batchers = {disease: MicroBatcher(disease, window_ms, max_batch) for disease in MODEL_CLASSES}
+
+    def start_warm_up(self):
+        """Load (or train) every model on a background thread"""
+        return registry.start_warm_up(list(self.batchers))
+
+    async def dispatch(self, method, path, body):
+        """Return (status, payload) for one request"""
+        if path == '/health':
+            stats = {d: {'batches': b.batches, 'rows': b.rows} for d, b in self.batchers.items()}
+            return HTTPStatus.OK, {'status': 'ok' if registry.is_ready() else 'warming_up',
+                                   'diseases': sorted(self.batchers), 'models': registry.status(),
+                                   'batching': stats}
+        if path == '/ready':
+            ready = registry.is_ready()
+            return HTTPStatus.OK if ready else HTTPStatus.SERVICE_UNAVAILABLE, {'ready': ready}
+        if path == '/metrics':
+            if not metrics.enabled:
+                raise RequestError(HTTPStatus.NOT_FOUND, "Metrics are off; start the service with --metrics")
+            return HTTPStatus.OK, metrics.to_prometheus()
+
+        prefix = '/predict/'
+        if not path.startswith(prefix):
+            raise RequestError(HTTPStatus.NOT_FOUND, f"No route for {path}")
+        disease = path[len(prefix):]
+        if disease not in self.batchers:
+            raise RequestError(HTTPStatus.NOT_FOUND, f"Unknown disease '{disease}'")
+        if method != 'POST':
+            raise RequestError(HTTPStatus.METHOD_NOT_ALLOWED, "Use POST")
+        if not registry.is_ready(disease):
+            raise RequestError(HTTPStatus.SERVICE_UNAVAILABLE, f"The {disease} model is still warming up")
+
+        try:
+            features = json.loads(body)['features']
+        except (ValueError, KeyError, TypeError):
+            raise RequestError(HTTPStatus.BAD_REQUEST, 'Body must be JSON like {"features": [...]}') from None
+        row = parse_features(disease, features)
+        return HTTPStatus.OK, await self.batchers[disease].submit(row)
+
+    async def handle_connection(self, reader, writer):
+        """Serve HTTP/1.1 requests (with keep-alive) on one connection"""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, version = request_line.decode('latin-1').split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get('content-length') or 0)
+                keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+                try:
+                    if length > MAX_BODY_BYTES:
+                        keep_alive = False
+                        raise RequestError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large")
+                    body = await reader.readexactly(length) if length else b''
+                    status, payload = await self.dispatch(method, target.split('?', 1)[0], body)
+                except RequestError as e:
+                    status, payload = e.status, {'error': str(e)}
+                except Exception as e:
+                    status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {'error': str(e)}
+
+                _write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+
+def _write_response(writer, status, payload, keep_alive):
+    if isinstance(payload, str):
+        body, content_type = payload.encode(), 'text/plain; version=0.0.4'
+    else:
+        body, content_type = json.dumps(payload).encode(), 'application/json'
+    head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    writer.write(head.encode('latin-1') + body)
+
+
+async def serve(host='127.0.0.1', port=8000, window_ms=2.0, max_batch=64):
+    service = InferenceService(window_ms, max_batch)
+    server = await asyncio.start_server(service.handle_connection, host, port)
+    service.start_warm_up()
+    print(f"Serving {', '.join(sorted(service.batchers))} on http://{host}:{port} "
+          f"(batch window {window_ms} ms, max batch {max_batch}); warming up models")
+    async with server:
+        await asyncio.gather(server.serve_forever(), report_readiness())
+
+
+async def report_readiness():
+    """Print each model's warm-up result once warm-up has finished"""
+    await asyncio.get_running_loop().run_in_executor(None, registry.wait_ready)
+    for disease, status in registry.status().items():
+        if status['state'] == READY:
+            how = 'trained' if status.get('trained') else 'loaded'
+            print(f"  {disease:<13} ready ({how} in {status['seconds']:.2f}s)")
+        else:
+            print(f"  {disease:<13} {status['state']}: {status.get('error', '')}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the disease models over HTTP with micro-batching")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--window-ms', type=float, default=2.0, help="how long to collect a batch (default 2)")
+    parser.add_argument('--max-batch', type=int, default=64, help="rows that trigger an early flush (default 64)")
+    parser.add_argument('--metrics', action='store_true', help="record stage timings for GET /metrics")
+    args = parser.parse_args(argv)
+
+    if args.metrics:
+        enable_metrics()
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.window_ms, args.max_batch))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
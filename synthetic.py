@@ -0,0 +1,190 @@
+"""
+Synthetic patient datasets at any scale
+
+Usage:
+    python -m ml_model.synthetic --disease stroke --rows 10000000 --out stroke_10m.parquet
+        [--in dataset/stroke.csv] [--chunksize 500000] [--seed 0]
+
+A Gaussian copula is fitted to a bundled CSV: every column keeps its own
+marginal distribution (observed category frequencies for categorical and
+low-cardinality columns, the empirical quantile function for continuous
+ones) and the dependence between columns, target included, is captured by
+the correlation of their normal scores. Sampled rows have the same columns,
+value types and rounding as the source file. Rows are generated and
+written chunk by chunk, so memory depends on --chunksize and not --rows.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from scipy.special import ndtr, ndtri
+
+from .model_registry import MODEL_CLASSES
+from .score import ChunkWriter
+
+DEFAULT_CHUNKSIZE = 500_000
+# Integer columns with at most this many distinct values are sampled as categories
+MAX_DISCRETE_VALUES = 10
+# Row identifiers are numbered rather than sampled
+ID_COLUMNS = ('id',)
+
+
+def _decimals(values):
+    """Number of decimal places needed to write the observed values back out"""
+    for places in range(7):
+        if np.allclose(values, np.round(values, places), rtol=0, atol=1e-9):
+            return places
+    return None
+
+
+class GaussianCopula:
+    """Column marginals plus a normal-score correlation matrix fitted to one DataFrame"""
+
+    def __init__(self, columns, marginals, correlation, random_state=None):
+        self.columns = columns
+        self.marginals = marginals
+        self.correlation = correlation
+        self._cholesky = np.linalg.cholesky(correlation)
+        self._rng = np.random.default_rng(random_state)
+        self._next_id = 1
+
+    @classmethod
+    def fit(cls, df, random_state=None):
+        marginals, scores = {}, []
+        for col in df.columns:
+            series = df[col]
+            missing = float(series.isna().mean())
+            observed = series.dropna()
+            if col in ID_COLUMNS:
+                marginals[col] = {'kind': 'id'}
+                continue
+
+            numeric = pd.api.types.is_numeric_dtype(series)
+            integral = numeric and np.allclose(observed, np.round(observed))
+            if not numeric or (integral and observed.nunique() <= MAX_DISCRETE_VALUES):
+                counts = observed.value_counts(sort=False).sort_index()
+                probabilities = (counts / counts.sum()).to_numpy()
+                upper = np.cumsum(probabilities)
+                upper[-1] = 1.0
+                values = counts.index.to_numpy()
+                if integral:
+                    # A column with gaps is read as float; its values are still integers
+                    values = values.astype(np.int64)
+                marginals[col] = {'kind': 'discrete', 'values': values,
+                                  'cumulative': upper, 'missing': missing, 'numeric': numeric}
+                # Each category scores at the middle of its probability band
+                codes = pd.Categorical(series, categories=counts.index).codes
+                lower = np.concatenate([[0.0], upper[:-1]])
+                u = np.where(codes >= 0, lower[codes] + 0.5 * probabilities[codes], 0.5)
+            else:
+                values = np.sort(observed.to_numpy(dtype=float))
+                marginals[col] = {'kind': 'continuous', 'quantiles': values, 'missing': missing,
+                                  'integral': integral, 'decimals': _decimals(values)}
+                ranks = series.rank(method='average').to_numpy()
+                u = np.where(np.isnan(ranks), 0.5, (ranks - 0.5) / len(observed))
+            scores.append(ndtri(np.clip(u, 1e-6, 1 - 1e-6)))
+
+        columns = list(df.columns)
+        if scores:
+            # Constant columns have no defined correlation; nan_to_num below zeroes it
+            with np.errstate(invalid='ignore', divide='ignore'):
+                correlation = np.atleast_2d(np.corrcoef(np.vstack(scores)))
+            # Small samples can give a matrix that is not quite positive definite
+            eigenvalues, eigenvectors = np.linalg.eigh(np.nan_to_num(correlation))
+            correlation = eigenvectors @ np.diag(np.clip(eigenvalues, 1e-6, None)) @ eigenvectors.T
+            d = np.sqrt(np.diag(correlation))
+            correlation = correlation / np.outer(d, d)
+        else:
+            correlation = np.eye(0)
+        return cls(columns, marginals, correlation, random_state)
+
+    def sample(self, n_rows):
+        """Draw n_rows synthetic rows as a DataFrame with the fitted columns"""
+        z = self._rng.standard_normal((n_rows, len(self.correlation))) @ self._cholesky.T
+        u = ndtr(z)
+
+        data, j = {}, 0
+        for col in self.columns:
+            m = self.marginals[col]
+            if m['kind'] == 'id':
+                data[col] = np.arange(self._next_id, self._next_id + n_rows)
+                continue
+            if m['kind'] == 'discrete':
+                codes = np.minimum(np.searchsorted(m['cumulative'], u[:, j], side='right'), len(m['values']) - 1)
+                column = m['values'][codes]
+            else:
+                q = m['quantiles']
+                column = np.interp(u[:, j] * (len(q) - 1), np.arange(len(q)), q)
+                if m['integral']:
+                    column = np.round(column).astype(np.int64)
+                elif m['decimals'] is not None:
+                    column = np.round(column, m['decimals'])
+            if m['missing']:
+                mask = self._rng.random(n_rows) < m['missing']
+                if column.dtype.kind == 'i':
+                    # Nullable, so integers stay integers in every chunk, with or without gaps
+                    column = pd.array(column, dtype='Int64')
+                    column[mask] = pd.NA
+                else:
+                    column = pd.Series(column).where(~mask).to_numpy()
+            data[col] = column
+            j += 1
+
+        self._next_id += n_rows
+        return pd.DataFrame(data, columns=self.columns)
+
+    def iter_samples(self, n_rows, chunksize=DEFAULT_CHUNKSIZE):
+        """Yield DataFrames of at most chunksize rows until n_rows have been drawn"""
+        for start in range(0, n_rows, chunksize):
+            yield self.sample(min(chunksize, n_rows - start))
+
+
+def fit_dataset(disease, data_path=None, random_state=None):
+    """Fit a GaussianCopula to a bundled dataset (or data_path)"""
+    return GaussianCopula.fit(pd.read_csv(data_path or f'dataset/{disease}.csv'), random_state)
+
+
+def generate_dataset(disease, n_rows, out_path, data_path=None, chunksize=DEFAULT_CHUNKSIZE,
+                     random_state=None, verbose=False):
+    """Write n_rows synthetic rows shaped like the disease's dataset to a CSV or Parquet file"""
+    copula = fit_dataset(disease, data_path, random_state)
+    rows = 0
+    start = time.perf_counter()
+    with ChunkWriter(out_path) as writer:
+        for chunk in copula.iter_samples(n_rows, chunksize):
+            writer.write(chunk)
+            rows += len(chunk)
+            if verbose:
+                elapsed = time.perf_counter() - start
+                print(f"  {rows:,} rows written ({rows / elapsed:,.0f} rows/s)", file=sys.stderr)
+    return out_path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic dataset shaped like a bundled CSV")
+    parser.add_argument('--disease', required=True, choices=sorted(MODEL_CLASSES))
+    parser.add_argument('--rows', type=int, required=True)
+    parser.add_argument('--out', dest='out_path', required=True, help="output .csv or .parquet file")
+    parser.add_argument('--in', dest='in_path', help="source CSV (default: dataset/<disease>.csv)")
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE,
+                        help=f"rows per chunk (default {DEFAULT_CHUNKSIZE:,})")
+    parser.add_argument('--seed', type=int, help="random seed for reproducible output")
+    parser.add_argument('--quiet', action='store_true')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    try:
+        generate_dataset(args.disease, args.rows, args.out_path, args.in_path, args.chunksize,
+                         args.seed, verbose=not args.quiet)
+    except (ImportError, ValueError) as e:
+        parser.error(str(e))
+    print(f"Wrote {args.rows:,} rows to {args.out_path} in {time.perf_counter() - start:.2f}s "
+          f"({os.path.getsize(args.out_path) / 1e6:,.1f} MB)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,208 @@
+"""
+Training configuration shared by the disease models, a streaming trainer
+for files too large to load at once, and a parallel "train all" orchestrator
+
+Usage:
+    python -m ml_model.training [--diseases heart stroke] [--workers 5] [--n-jobs 2]
+        [--chunksize 500000] [--force]
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, replace
+from typing import Optional
+
+import numpy as np
+
+from .model_registry import MODEL_CLASSES, get_model_class
+
+
+@dataclass(frozen=True)
+class TrainingConfig:
+    """Settings that control how a model is trained.
+
+    n_jobs is the number of cores each forest is fitted on (-1 = all cores).
+    predict_n_jobs is stored on the saved forest and used at prediction time;
+    it defaults to a single thread because interactive requests score one
+    row, where thread dispatch costs more than it saves.
+    chunksize switches train() to fit_streaming(), reading the data file
+    that many rows at a time instead of loading it whole.
+    decision_threshold overrides the model's probability cut-off for the
+    positive class; it is saved with the trained model.
+    reuse_cached lets train() return the saved model instead of retraining
+    when the data file and everything that shapes the model are unchanged.
+    """
+    n_jobs: Optional[int] = -1
+    predict_n_jobs: Optional[int] = None
+    chunksize: Optional[int] = None
+    decision_threshold: Optional[float] = None
+    reuse_cached: bool = True
+
+
+DEFAULT_CONFIG = TrainingConfig()
+
+# Part of every fingerprint; bump it when a code change alters what train() produces
+FINGERPRINT_VERSION = 1
+
+StreamingFit = namedtuple('StreamingFit', ['model', 'scaler', 'label_encoders', 'test_accuracy'])
+
+
+def fingerprint(data_path, params):
+    """Content hash of a training file and the JSON-serialisable params that shape the model"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(json.dumps({'fingerprint_version': FINGERPRINT_VERSION, **params},
+                             sort_keys=True, default=str).encode())
+    with open(data_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _holdout_mask(n_rows, chunk_index, test_size, random_state):
+    """Rows of one chunk held out for evaluation; the same on every pass over the file"""
+    return np.random.default_rng((random_state, chunk_index)).random(n_rows) < test_size
+
+
+def fit_streaming(forest, data_path, target, config, schema=None, drop=(), categorical=(),
+                  test_size=0.2, random_state=42):
+    """Fit a scaler and a random forest by streaming data_path in config.chunksize rows.
+
+    A first pass fits the StandardScaler with partial_fit and collects the
+    classes (preceded by a pass collecting categorical vocabularies, which
+    must be known before anything is encoded). The last pass fits a small
+    forest, a clone of the given (unfitted) one, on each chunk's bootstrap
+    samples and merges their trees, so memory is bounded by the chunk size
+    rather than the file. Each chunk contributes at least one tree; chunks
+    missing a class are skipped. A test_size share of every chunk is held
+    out, and up to one chunk of those rows is used for test_accuracy.
+    schema maps columns to the dtypes each chunk is read with.
+
+    Returns StreamingFit(model, scaler, label_encoders, test_accuracy).
+    """
+    import pandas as pd
+    from sklearn.base import clone
+    from sklearn.preprocessing import LabelEncoder, StandardScaler
+
+    from .score import iter_chunks
+
+    drop = [target, *drop]
+    scaler = StandardScaler()
+    classes, vocabularies, holdout = set(), {col: set() for col in categorical}, []
+    holdout_rows = n_chunks = 0
+
+    def features(df):
+        X = df.drop(columns=drop)
+        for col in categorical:
+            X[col] = label_encoders[col].transform(X[col])
+        return X.to_numpy(dtype=np.float64, na_value=np.nan)
+
+    if categorical:
+        for chunk in iter_chunks(data_path, config.chunksize, schema):
+            for col in categorical:
+                vocabularies[col].update(chunk[col].unique())
+    label_encoders = {col: LabelEncoder().fit(sorted(values)) for col, values in vocabularies.items()}
+
+    # Scaler statistics, classes and a bounded evaluation sample
+    for i, chunk in enumerate(iter_chunks(data_path, config.chunksize, schema)):
+        test = _holdout_mask(len(chunk), i, test_size, random_state)
+        if holdout_rows < config.chunksize and test.any():
+            holdout.append(chunk[test].head(config.chunksize - holdout_rows))
+            holdout_rows += len(holdout[-1])
+        if not test.all():
+            classes.update(chunk[target][~test].unique())
+            scaler.partial_fit(features(chunk[~test]))
+            n_chunks += 1
+    if not n_chunks:
+        raise ValueError(f"No training rows in {data_path}")
+
+    # One small forest per chunk, then merge the trees into a single forest
+    trees_per_chunk = max(1, math.ceil(forest.n_estimators / n_chunks))
+    merged, skipped = None, 0
+    for i, chunk in enumerate(iter_chunks(data_path, config.chunksize, schema)):
+        train = chunk[~_holdout_mask(len(chunk), i, test_size, random_state)]
+        if set(train[target].unique()) != classes:
+            skipped += 1
+            continue
+        part = clone(forest).set_params(n_estimators=trees_per_chunk, random_state=random_state + i)
+        part.fit(scaler.transform(features(train)), train[target])
+        if merged is None:
+            merged = part
+        else:
+            merged.estimators_ += part.estimators_
+    if merged is None:
+        raise ValueError(f"No chunk of {data_path} contains every class; use a larger chunksize")
+    merged.n_estimators = len(merged.estimators_)
+    if skipped:
+        print(f"Skipped {skipped} chunk(s) without every class")
+
+    test_accuracy = None
+    if holdout:
+        test = pd.concat(holdout)
+        test_accuracy = merged.score(scaler.transform(features(test)), test[target])
+    return StreamingFit(merged, scaler, label_encoders, test_accuracy)
+
+
+def _train_one(disease, config, data_path=None):
+    """Train one disease model and return (disease, seconds); runs in a worker process"""
+    model = get_model_class(disease)()
+    start = time.perf_counter()
+    if data_path is None:
+        model.train(config=config)
+    else:
+        model.train(data_path, config=config)
+    return disease, time.perf_counter() - start
+
+
+def train_all(diseases=None, config=None, max_workers=None, data_paths=None):
+    """Train several disease models concurrently in a process pool.
+
+    When config.n_jobs is -1 the machine's cores are divided between the
+    models being trained, so concurrent forests do not oversubscribe the CPU.
+    Returns a dict of disease -> training seconds.
+    """
+    diseases = list(diseases or MODEL_CLASSES)
+    config = config or DEFAULT_CONFIG
+    data_paths = data_paths or {}
+    max_workers = max_workers or len(diseases)
+    if config.n_jobs == -1:
+        config = replace(config, n_jobs=max(1, (os.cpu_count() or 1) // min(max_workers, len(diseases))))
+
+    timings = {}
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(_train_one, disease, config, data_paths.get(disease)) for disease in diseases]
+        for future in as_completed(futures):
+            disease, seconds = future.result()
+            timings[disease] = seconds
+            print(f"  {disease:<13} trained in {seconds:6.2f}s")
+
+    wall = time.perf_counter() - start
+    print(f"Trained {len(timings)} model(s) in {wall:.2f}s wall time "
+          f"({sum(timings.values()):.2f}s if run one after another)")
+    return timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Train the disease models in parallel")
+    parser.add_argument('--diseases', nargs='+', choices=sorted(MODEL_CLASSES), help="default: all")
+    parser.add_argument('--workers', type=int, help="concurrent training processes (default: one per model)")
+    parser.add_argument('--n-jobs', type=int, default=-1,
+                        help="cores per forest (default -1: share all cores between the models)")
+    parser.add_argument('--chunksize', type=int,
+                        help="stream each data file this many rows at a time (default: load it whole)")
+    parser.add_argument('--force', action='store_true',
+                        help="retrain even when the data and parameters match a saved model")
+    args = parser.parse_args(argv)
+
+    config = TrainingConfig(n_jobs=args.n_jobs, chunksize=args.chunksize, reuse_cached=not args.force)
+    train_all(args.diseases, config, max_workers=args.workers)
+
+
+if __name__ == '__main__':
+    main()